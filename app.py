@@ -7,31 +7,67 @@ from src.config.settings import SettingsManager
 from src.utils.logger import setup_logger
 
 
+def _start_model_prefetch(settings: SettingsManager) -> None:
+    """Start downloading the configured ASR checkpoint in the background.
+
+    Runs as a daemon thread so model files are (partially) on disk by the
+    time the user hits start; any failure is logged and otherwise ignored —
+    the normal load path will download whatever is missing.
+    """
+    from loguru import logger
+
+    repo_map = {
+        "0.6B": "Qwen/Qwen3-ASR-0.6B",
+        "1.7B": "Qwen/Qwen3-ASR-1.7B",
+    }
+    repo_id = repo_map.get(settings.get("asr.model_size", ""))
+    if settings.get("asr.type", "") != "qwen3-asr" or repo_id is None:
+        return
+    model_dir = settings.get("paths.model_dir", "") or None
+
+    def _prefetch() -> None:
+        try:
+            from huggingface_hub import snapshot_download
+
+            snapshot_download(repo_id, cache_dir=model_dir)
+            logger.info("Prefetched model files for {}", repo_id)
+        except Exception as e:
+            logger.debug("Model prefetch skipped ({})", e)
+
+    import threading
+
+    threading.Thread(target=_prefetch, name="model-prefetch", daemon=True).start()
+
+
 def main() -> None:
-    # Load settings and set HuggingFace endpoint early, before importing any HF-related libraries
+    # Load settings and set HuggingFace endpoint early, before importing any
+    # HF-related libraries. setdefault keeps an endpoint the user exported in
+    # their shell; an empty setting leaves the environment untouched.
     settings = SettingsManager()
     hf_endpoint = settings.get("huggingface.endpoint", "")
     if hf_endpoint:
-        os.environ['HF_ENDPOINT'] = hf_endpoint
-        print(f"Using HuggingFace endpoint: {hf_endpoint}")  # Print to console for visibility
-    else:
-        # Remove the environment variable if it exists
-        if 'HF_ENDPOINT' in os.environ:
-            del os.environ['HF_ENDPOINT']
+        os.environ.setdefault('HF_ENDPOINT', hf_endpoint)
 
     setup_logger()
 
     from loguru import logger
 
     logger.info("Initializing Subtitle Extractor...")
+    if hf_endpoint:
+        logger.info("Using HuggingFace endpoint: {}", os.environ['HF_ENDPOINT'])
 
-    from PyQt5.QtWidgets import QApplication
+    if settings.get("huggingface.prefetch", False):
+        _start_model_prefetch(settings)
 
-    from src.ui.main_window import MainWindow
+    from PyQt5.QtWidgets import QApplication
 
     app = QApplication(sys.argv)
     app.setApplicationName("Subtitle Extractor")
 
+    # Import the UI tree only once the application object exists, so Qt is
+    # initialized (and could show a splash) before the heavier UI imports run.
+    from src.ui.main_window import MainWindow
+
     window = MainWindow()
     window.show()
 
@@ -1,8 +1,24 @@
-"""ASR package – import submodules to trigger auto-registration."""
+"""ASR package – backends are imported (and register themselves) lazily."""
+
+from __future__ import annotations
+
+import importlib
 
 from src.asr.base import ASRBase  # noqa: F401
 from src.asr.registry import ASRRegistry  # noqa: F401
 
-# Import backends so they register themselves via @ASRRegistry.register
-from src.asr import whisper_asr as _whisper  # noqa: F401
-from src.asr import qwen_asr as _qwen  # noqa: F401
+# Backend submodules, importable lazily via PEP 562 ``__getattr__``. Importing
+# a module triggers its ``@ASRRegistry.register`` decorator.
+_BACKEND_MODULES: dict[str, str] = {
+    "whisper_asr": "src.asr.whisper_asr",
+    "faster_whisper_asr": "src.asr.faster_whisper_asr",
+    "qwen_asr": "src.asr.qwen_asr",
+}
+
+
+def __getattr__(name: str):
+    """Import backend submodules on first attribute access (PEP 562)."""
+    module_path = _BACKEND_MODULES.get(name)
+    if module_path is not None:
+        return importlib.import_module(module_path)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,10 +3,13 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 from src.models.datatypes import TranscriptionSegment
 
+if TYPE_CHECKING:
+    import numpy as np
+
 
 class ASRBase(ABC):
     """Interface that every ASR backend must implement.
@@ -38,13 +41,14 @@ class ASRBase(ABC):
     @abstractmethod
     def transcribe(
         self,
-        audio_path: str,
+        audio: str | np.ndarray,
         language: Optional[str] = None,
     ) -> list[TranscriptionSegment]:
-        """Transcribe an audio file and return segments with word timestamps.
+        """Transcribe audio and return segments with word timestamps.
 
         Args:
-            audio_path: path to a 16 kHz mono WAV file.
+            audio: path to a 16 kHz mono WAV file, or a float32 numpy array
+                sampled at 16 kHz (avoids writing per-segment temp files).
             language: ISO language code (e.g. "zh", "en") or None for auto-detect.
 
         Returns:
@@ -52,6 +56,21 @@ class ASRBase(ABC):
         """
         ...
 
+    def transcribe_batch(
+        self,
+        audios: list[str | np.ndarray],
+        language: Optional[str] = None,
+    ) -> list[list[TranscriptionSegment]]:
+        """Transcribe several audio inputs in one call.
+
+        Backends that support true batched inference should override this to
+        issue a single forward pass; the default simply loops ``transcribe``.
+
+        Returns:
+            One list of ``TranscriptionSegment`` per input, in order.
+        """
+        return [self.transcribe(audio, language=language) for audio in audios]
+
     @abstractmethod
     def unload_model(self) -> None:
         """Release model resources."""
@@ -0,0 +1,95 @@
+"""Faster-Whisper ASR backend (CTranslate2 reimplementation of Whisper)."""
+
+from __future__ import annotations
+
+from typing import Optional
+
+from loguru import logger
+
+from src.asr.base import ASRBase
+from src.asr.registry import ASRRegistry
+from src.models.datatypes import TranscriptionSegment, WordTimestamp
+
+
+@ASRRegistry.register
+class FasterWhisperASR(ASRBase):
+    """ASR backend using faster-whisper.
+
+    Same checkpoints as Whisper, run through CTranslate2 with int8
+    quantization: typically ~4x faster with roughly half the memory,
+    at equal accuracy.
+    """
+
+    _MODEL_SIZES = ["tiny", "base", "small", "medium", "large-v3", "turbo"]
+
+    @classmethod
+    def name(cls) -> str:
+        return "Faster-Whisper"
+
+    @classmethod
+    def available_model_sizes(cls) -> list[str]:
+        return list(cls._MODEL_SIZES)
+
+    def load_model(self) -> None:
+        from faster_whisper import WhisperModel
+
+        # int8 weights everywhere; on GPU the activations stay float16
+        compute_type = "int8" if self.device == "cpu" else "int8_float16"
+
+        logger.info(
+            "Loading Faster-Whisper model '{}' on {} ({})...",
+            self.model_size, self.device, compute_type,
+        )
+        kwargs: dict = {
+            "device": self.device,
+            "compute_type": compute_type,
+        }
+        if self.model_dir:
+            kwargs["download_root"] = self.model_dir
+        self._model = WhisperModel(self.model_size, **kwargs)
+        logger.info("Faster-Whisper model loaded.")
+
+    def transcribe(
+        self,
+        audio,
+        language: Optional[str] = None,
+    ) -> list[TranscriptionSegment]:
+        if self._model is None:
+            raise RuntimeError("Model not loaded. Call load_model() first.")
+
+        logger.debug(
+            "Faster-Whisper transcribing: {}",
+            audio if isinstance(audio, str) else "<in-memory audio>",
+        )
+        opts: dict = {"word_timestamps": True}
+        if language and language != "auto":
+            opts["language"] = language
+
+        raw_segments, _info = self._model.transcribe(audio, **opts)
+
+        segments: list[TranscriptionSegment] = []
+        # raw_segments is a lazy generator; iterating it runs the decode
+        for seg in raw_segments:
+            words: list[WordTimestamp] = []
+            for w in seg.words or []:
+                words.append(
+                    WordTimestamp(
+                        word=w.word.strip(),
+                        start=float(w.start),
+                        end=float(w.end),
+                    )
+                )
+            segments.append(
+                TranscriptionSegment(
+                    start_time=float(seg.start),
+                    end_time=float(seg.end),
+                    text=seg.text.strip(),
+                    words=words,
+                )
+            )
+        logger.debug("Faster-Whisper returned {} segment(s).", len(segments))
+        return segments
+
+    def unload_model(self) -> None:
+        self._model = None
+        logger.info("Faster-Whisper model unloaded.")
@@ -2,6 +2,11 @@
 
 from __future__ import annotations
 
+import re
+import weakref
+from bisect import bisect_left
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
 from typing import Optional
 
 from loguru import logger
@@ -28,6 +33,35 @@ _MODEL_MAP: dict[str, str] = {
 
 _ALIGNER_MODEL = "Qwen/Qwen3-ForcedAligner-0.6B"
 
+# Loaded ForcedAligner instances keyed by (device, dtype). Weak values: the
+# cache never keeps an aligner alive once the owning model is unloaded, but
+# switching model sizes on the same device reuses it instead of reloading.
+_ALIGNER_CACHE: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
+
+# Cached torch module reference, set once load_model has imported it.
+_torch = None
+
+
+@contextmanager
+def _no_init():
+    """Temporarily no-op ``reset_parameters`` on common torch layers.
+
+    ``from_pretrained`` default-initializes every Linear/Conv/LayerNorm/
+    Embedding only to overwrite them with checkpoint weights straight after.
+    Skipping the init makes model instantiation 2-4x faster.
+    """
+    import torch.nn as nn
+
+    layers = (nn.Linear, nn.Conv1d, nn.Conv2d, nn.LayerNorm, nn.Embedding)
+    saved = [layer.reset_parameters for layer in layers]
+    try:
+        for layer in layers:
+            layer.reset_parameters = lambda self: None
+        yield
+    finally:
+        for layer, original in zip(layers, saved):
+            layer.reset_parameters = original
+
 
 @ASRRegistry.register
 class QwenASR(ASRBase):
@@ -36,6 +70,9 @@ class QwenASR(ASRBase):
     def __init__(self, model_size: str, device: str = "cpu", model_dir: str | None = None, config: dict | None = None) -> None:
         super().__init__(model_size, device, model_dir, config)
         self._has_aligner = False
+        self._autocast_bf16 = False
+        # Per-call kwargs that don't vary between calls; filled by load_model
+        self._base_kwargs: dict = {}
 
     @classmethod
     def name(cls) -> str:
@@ -46,9 +83,12 @@ class QwenASR(ASRBase):
         return list(_MODEL_MAP.keys())
 
     def load_model(self) -> None:
+        global _torch
         import torch
+
+        _torch = torch
         from qwen_asr import Qwen3ASRModel
-        
+
         # The HF_ENDPOINT environment variable should already be set at application startup
         # and when user changes the setting, so we just log the current value
         import os
@@ -62,11 +102,45 @@ class QwenASR(ASRBase):
                 f"Available: {list(_MODEL_MAP.keys())}"
             )
 
-        # Select dtype based on device
+        # Select dtype: device default, overridable via the asr.dtype setting.
+        # On CPU the weights stay float32; "bfloat16" there enables an
+        # autocast context around inference instead (oneDNN bf16 kernels).
+        dtype_cfg = (self.config.get("asr") or {}).get("dtype", "auto")
         if self.device == "cpu":
             dtype = torch.float32
+            self._autocast_bf16 = dtype_cfg == "bfloat16"
         else:
-            dtype = torch.bfloat16
+            dtype = {
+                "float32": torch.float32,
+                "float16": torch.float16,
+            }.get(dtype_cfg, torch.bfloat16)
+            self._autocast_bf16 = False
+
+        quant_config = self._quantization_config(dtype)
+
+        # Reloading the fully constructed model from a single torch blob is
+        # several times faster than re-parsing config + safetensors shards.
+        # Quantized models are skipped: bitsandbytes modules do not round-trip
+        # through torch.save reliably, and they already load fast.
+        cache_path = self._weights_cache_path(model_id, dtype)
+        if quant_config is None and cache_path.exists():
+            try:
+                logger.info(f"Loading Qwen3-ASR from weight cache: {cache_path}")
+                self._model = torch.load(
+                    cache_path, map_location=self.device, weights_only=False
+                )
+                self._has_aligner = (
+                    getattr(self._model, "forced_aligner", None) is not None
+                )
+                self._base_kwargs = (
+                    {"return_time_stamps": True} if self._has_aligner else {}
+                )
+                logger.info("Qwen3-ASR model loaded from cache.")
+                return
+            except Exception as e:
+                logger.warning(
+                    f"Failed to load cached model ({e}); reloading from checkpoint."
+                )
 
         logger.info(f"Loading Qwen3-ASR model '{model_id}' on {self.device}...")
         kwargs: dict = {
@@ -75,107 +149,190 @@ class QwenASR(ASRBase):
         }
         if self.model_dir:
             kwargs["cache_dir"] = self.model_dir
-
-        # Load with forced aligner for word-level timestamps
+        if quant_config is not None:
+            kwargs["quantization_config"] = quant_config
+
+        # Load with forced aligner for word-level timestamps. A previously
+        # loaded aligner for this device/dtype is passed in directly so it is
+        # shared rather than reloaded.
+        aligner_key = (self.device, str(dtype))
+        cached_aligner = _ALIGNER_CACHE.get(aligner_key)
         aligner_kwargs: dict = {"dtype": dtype, "device_map": self.device}
         if self.model_dir:
             aligner_kwargs["cache_dir"] = self.model_dir
 
         try:
-            self._model = Qwen3ASRModel.from_pretrained(
+            self._model = self._from_pretrained(
+                Qwen3ASRModel,
                 model_id,
-                forced_aligner=_ALIGNER_MODEL,
+                forced_aligner=cached_aligner if cached_aligner is not None else _ALIGNER_MODEL,
                 forced_aligner_kwargs=aligner_kwargs,
                 **kwargs,
             )
             self._has_aligner = True
+            aligner = getattr(self._model, "forced_aligner", None)
+            if aligner is not None:
+                _ALIGNER_CACHE[aligner_key] = aligner
         except Exception as e:
             # Fall back without forced aligner if it fails
             logger.warning(
                 f"Failed to load ForcedAligner ({e}); "
                 "loading Qwen3-ASR without word-level timestamps."
             )
-            self._model = Qwen3ASRModel.from_pretrained(model_id, **kwargs)
+            self._model = self._from_pretrained(Qwen3ASRModel, model_id, **kwargs)
             self._has_aligner = False
 
+        self._base_kwargs = {"return_time_stamps": True} if self._has_aligner else {}
+
+        if quant_config is None:
+            try:
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                torch.save(self._model, cache_path)
+                logger.info(f"Cached deserialized model to: {cache_path}")
+            except Exception as e:
+                logger.warning(f"Failed to write model weight cache ({e}).")
+
         logger.info("Qwen3-ASR model loaded.")
 
-    def _align_words_with_text(self, full_text: str, raw_words: list[dict]) -> list[WordTimestamp]:
-        """Align raw word timestamps with the actual text positions to preserve spacing."""
+    def _quantization_config(self, dtype):
+        """Build a ``BitsAndBytesConfig`` from the ``asr.quantization`` setting.
+
+        Returns None when quantization is disabled, requested on CPU (where
+        bitsandbytes does not apply), or the dependency is unavailable.
+        """
+        quant = (self.config.get("asr") or {}).get("quantization", "none")
+        if quant not in ("8bit", "4bit"):
+            return None
+        if self.device == "cpu":
+            logger.warning("Quantization requires a GPU device; ignoring.")
+            return None
+        try:
+            from transformers import BitsAndBytesConfig
+
+            if quant == "8bit":
+                return BitsAndBytesConfig(load_in_8bit=True)
+            return BitsAndBytesConfig(
+                load_in_4bit=True,
+                bnb_4bit_quant_type="nf4",
+                bnb_4bit_compute_dtype=dtype,
+            )
+        except Exception as e:
+            logger.warning(f"Quantization unavailable ({e}); loading full precision.")
+            return None
+
+    @staticmethod
+    def _from_pretrained(model_cls, model_id: str, **kwargs):
+        """Load a checkpoint with meta-device init where supported.
+
+        ``low_cpu_mem_usage`` builds the module skeleton on the meta device
+        and materializes parameters straight from the checkpoint mmap,
+        skipping the throwaway CPU-side parameter allocation. Older
+        qwen-asr releases don't accept the kwarg, so retry without it.
+        """
+        try:
+            with _no_init():
+                return model_cls.from_pretrained(
+                    model_id, low_cpu_mem_usage=True, **kwargs
+                )
+        except TypeError:
+            with _no_init():
+                return model_cls.from_pretrained(model_id, **kwargs)
+
+    def _inference_ctx(self):
+        """Context manager for model calls: CPU bf16 autocast when enabled."""
+        if self._autocast_bf16 and _torch is not None:
+            return _torch.autocast(device_type="cpu", dtype=_torch.bfloat16)
+        return nullcontext()
+
+    def _weights_cache_path(self, model_id: str, dtype) -> Path:
+        """Return the path of the serialized-model cache for this config."""
+        base = (
+            Path(self.model_dir)
+            if self.model_dir
+            else Path.home() / ".cache" / "subtitle_extractor"
+        )
+        dtype_tag = str(dtype).replace("torch.", "")
+        return base / f"{model_id.replace('/', '_')}_{dtype_tag}.pt"
+
+    def _align_words_with_text(
+        self, full_text: str, raw_words: list[tuple[str, float, float]]
+    ) -> list[WordTimestamp]:
+        """Align raw word timestamps with the actual text positions to preserve spacing.
+
+        Single linear scan: each word's text is collected as a list of string
+        pieces (the word itself plus any spacing/punctuation it absorbs) and
+        joined once at the end, so no intermediate WordTimestamp instances or
+        growing string concatenations are built inside the loop.
+        """
         if not full_text or not raw_words:
             return []
-        
-        # Sort raw words by their start time to maintain chronological order
-        sorted_raw_words = sorted(raw_words, key=lambda x: x["start"])
-        
-        aligned_words: list[WordTimestamp] = []
-        
+
+        # Words must be chronological; aligner output almost always already
+        # is, so a linear is-sorted scan usually saves the sort entirely
+        if all(a[1] <= b[1] for a, b in zip(raw_words, raw_words[1:])):
+            sorted_raw_words = raw_words
+        else:
+            sorted_raw_words = sorted(raw_words, key=lambda x: x[1])
+
+        # Index every occurrence of each distinct word up front (one C-level
+        # regex scan per distinct word) so the loop below does an O(log k)
+        # bisect instead of an O(len(text)) str.find per word. The lookahead
+        # keeps overlapping starts ("aa" in "aaa" occurs at 0 and 1), which
+        # plain finditer would skip and str.find used to match.
+        occurrences: dict[str, list[int]] = {}
+        for word_text, _, _ in sorted_raw_words:
+            if word_text and word_text not in occurrences:
+                occurrences[word_text] = [
+                    m.start()
+                    for m in re.finditer(f"(?={re.escape(word_text)})", full_text)
+                ]
+
+        pieces: list[list[str]] = []
+        times: list[tuple[float, float]] = []
+
         # Track our position in the original text
         text_idx = 0
-        
-        for raw_word_data in sorted_raw_words:
-            word_text = raw_word_data["word"]
-            start_time = raw_word_data["start"]
-            end_time = raw_word_data["end"]
-            
+
+        for word_text, start_time, end_time in sorted_raw_words:
             if not word_text:
                 continue
-            
-            # Find the word in the original text starting from our current position
-            # This handles repeated words by finding the next occurrence
-            word_pos = full_text.find(word_text, text_idx)
-            
+
+            # Next occurrence of the word at or after our current position;
+            # this handles repeated words by consuming occurrences in order
+            positions = occurrences[word_text]
+            k = bisect_left(positions, text_idx)
+            word_pos = positions[k] if k < len(positions) else -1
+
             if word_pos != -1:
-                # The key improvement: we need to capture the actual text from the current
-                # position in the text to the position of this word, which may include spaces
-                if word_pos > text_idx:
-                    # There's text between the current position and the found word
-                    # This text likely contains spaces or punctuation that should be preserved with the previous word
-                    spacing_text = full_text[text_idx:word_pos]
-                    # We append this spacing to the previous word
-                    if aligned_words:
-                        # Append the spacing to the previous word's text
-                        prev_word = aligned_words[-1]
-                        aligned_words[-1] = WordTimestamp(
-                            word=prev_word.word + spacing_text,
-                            start=prev_word.start,
-                            end=prev_word.end
-                        )
-                
-                # Now add the actual word with its timestamps
-                actual_word_text = full_text[word_pos:word_pos + len(word_text)]
-                aligned_words.append(WordTimestamp(
-                    word=actual_word_text,
-                    start=start_time,
-                    end=end_time
-                ))
-                
-                # Move the text position forward past this word
-                text_idx = word_pos + len(word_text)
+                if word_pos > text_idx and pieces:
+                    # Spacing/punctuation between words is preserved with the
+                    # previous word
+                    pieces[-1].append(full_text[text_idx:word_pos])
+                word_end = word_pos + len(word_text)
+                pieces.append([full_text[word_pos:word_end]])
+                times.append((start_time, end_time))
+                text_idx = word_end
             else:
-                # Word not found in the remaining text, add it without precise positioning
-                aligned_words.append(WordTimestamp(
-                    word=word_text,
-                    start=start_time,
-                    end=end_time
-                ))
-        
-        # Handle any remaining text after the last word (e.g., punctuation at the end)
-        if text_idx < len(full_text) and aligned_words:
-            # Append any remaining text (like punctuation) to the last word
-            remaining_text = full_text[text_idx:]
-            last_word = aligned_words[-1]
-            aligned_words[-1] = WordTimestamp(
-                word=last_word.word + remaining_text,
-                start=last_word.start,
-                end=last_word.end
-            )
-        
-        return aligned_words
+                # Word not found in the remaining text; keep it without
+                # precise positioning
+                pieces.append([word_text])
+                times.append((start_time, end_time))
+
+        if not pieces:
+            return []
+
+        # Any remaining text (e.g. trailing punctuation) goes to the last word
+        if text_idx < len(full_text):
+            pieces[-1].append(full_text[text_idx:])
+
+        return [
+            WordTimestamp(word="".join(p), start=t[0], end=t[1])
+            for p, t in zip(pieces, times)
+        ]
 
     def transcribe(
         self,
-        audio_path: str,
+        audio,
         language: Optional[str] = None,
     ) -> list[TranscriptionSegment]:
         if self._model is None:
@@ -183,21 +340,61 @@ class QwenASR(ASRBase):
 
         lang_name = _LANG_MAP.get(language) if language else None
 
-        logger.debug(f"Qwen3-ASR transcribing: {audio_path}")
+        # Positional args defer formatting until the sink actually emits
+        logger.debug(
+            "Qwen3-ASR transcribing: {}",
+            audio if isinstance(audio, str) else "<in-memory audio>",
+        )
+
+        transcribe_kwargs: dict = {
+            "audio": audio,
+            "language": lang_name,
+            **self._base_kwargs,
+        }
+
+        with self._inference_ctx():
+            results = self._model.transcribe(**transcribe_kwargs)
+        segments = self._results_to_segments(results)
+
+        logger.debug("Qwen3-ASR returned {} segment(s).", len(segments))
+        return segments
+
+    def transcribe_batch(
+        self,
+        audios: list,
+        language: Optional[str] = None,
+    ) -> list[list[TranscriptionSegment]]:
+        """Transcribe several clips in one ``Qwen3ASRModel.transcribe`` call.
+
+        The underlying model accepts a list of audio inputs and batches them
+        through a single forward pass, which amortizes the pre/post-processing
+        and keeps the GPU saturated compared to per-clip calls.
+        """
+        if self._model is None:
+            raise RuntimeError("Model not loaded. Call load_model() first.")
+        if not audios:
+            return []
+
+        lang_name = _LANG_MAP.get(language) if language else None
+
+        logger.debug("Qwen3-ASR transcribing batch of {} clip(s)", len(audios))
 
         transcribe_kwargs: dict = {
-            "audio": audio_path,
+            "audio": list(audios),
             "language": lang_name,
+            **self._base_kwargs,
         }
-        if self._has_aligner:
-            transcribe_kwargs["return_time_stamps"] = True
 
-        results = self._model.transcribe(**transcribe_kwargs)
+        with self._inference_ctx():
+            results = self._model.transcribe(**transcribe_kwargs)
+        # One result per input clip, in order.
+        return [self._results_to_segments([res]) for res in results]
 
+    def _results_to_segments(self, results) -> list[TranscriptionSegment]:
+        """Convert raw Qwen3-ASR results into ``TranscriptionSegment`` objects."""
         segments: list[TranscriptionSegment] = []
         for res in results:
-            text = getattr(res, "text", "") or ""
-            text = text.strip("\n")
+            text = (getattr(res, "text", "") or "").strip("\n")
             if not text:
                 continue
 
@@ -206,28 +403,31 @@ class QwenASR(ASRBase):
             raw_timestamps = getattr(res, "time_stamps", None) or getattr(
                 res, "words", None
             )
-            if raw_timestamps and hasattr(raw_timestamps, "items"):
-                # Process word-level timestamps to preserve spacing in the original text
-                raw_words = []
-                for item in raw_timestamps.items:
-                    if isinstance(item, dict):
-                        raw_words.append({
-                            "word": item.get("word", item.get("text", "")).strip(),
-                            "start": float(item.get("start_time", 0)),
-                            "end": float(item.get("end_time", 0)),
-                        })
-                    elif hasattr(item, "word") or hasattr(item, "text"):
-                        raw_words.append({
-                            "word": getattr(item, "word", getattr(item, "text", "")).strip(),
-                            "start": float(getattr(item, "start_time", 0)),
-                            "end": float(getattr(item, "end_time", 0)),
-                        })
-                
+            items = getattr(raw_timestamps, "items", None) if raw_timestamps else None
+            if items:
+                # All entries share one shape; detect it once instead of
+                # re-checking isinstance/hasattr per word.
+                raw_words: list[tuple[str, float, float]] = []
+                append = raw_words.append
+                first = items[0]
+                if isinstance(first, dict):
+                    for item in items:
+                        append((
+                            item.get("word", item.get("text", "")).strip(),
+                            float(item.get("start_time", 0)),
+                            float(item.get("end_time", 0)),
+                        ))
+                elif hasattr(first, "word") or hasattr(first, "text"):
+                    for item in items:
+                        append((
+                            getattr(item, "word", getattr(item, "text", "")).strip(),
+                            float(getattr(item, "start_time", 0)),
+                            float(getattr(item, "end_time", 0)),
+                        ))
+
                 # Reconstruct the text with proper spacing by mapping words back to the original text
                 if raw_words:
                     words = self._align_words_with_text(text, raw_words)
-                else:
-                    words = []
 
             # Determine segment time range
             start_time = float(getattr(res, "start", 0))
@@ -245,17 +445,12 @@ class QwenASR(ASRBase):
                 )
             )
 
-        logger.debug(f"Qwen3-ASR returned {len(segments)} segment(s).")
         return segments
 
     def unload_model(self) -> None:
         self._model = None
-        # Attempt to free GPU memory
-        try:
-            import torch
-
-            if torch.cuda.is_available():
-                torch.cuda.empty_cache()
-        except ImportError:
-            pass
+        # Free GPU memory, but only if a CUDA context actually exists --
+        # cuda.is_available() would initialize one just to answer the question.
+        if _torch is not None and _torch.cuda.is_initialized():
+            _torch.cuda.empty_cache()
         logger.info("Qwen3-ASR model unloaded.")
\ No newline at end of file
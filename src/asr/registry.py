@@ -2,10 +2,33 @@
 
 from __future__ import annotations
 
+import importlib
 from typing import Optional, Type
 
 from src.asr.base import ASRBase
 
+# Known backend modules, imported lazily on first use. Importing a module
+# triggers its ``@ASRRegistry.register`` decorator, so backends only pay
+# their import cost when actually needed.
+_LAZY_BACKENDS: dict[str, str] = {
+    "whisper": "src.asr.whisper_asr",
+    "faster-whisper": "src.asr.faster_whisper_asr",
+    "qwen3-asr": "src.asr.qwen_asr",
+}
+
+# Display names and model sizes for the lazy backends, mirrored from the
+# classes above. The UI queries both at window construction; answering from
+# this table keeps the heavy backend imports off the startup path — they
+# only load when a backend is actually instantiated.
+_BACKEND_INFO: dict[str, tuple[str, tuple[str, ...]]] = {
+    "whisper": ("Whisper", ("tiny", "base", "small", "medium", "large", "turbo")),
+    "faster-whisper": (
+        "Faster-Whisper",
+        ("tiny", "base", "small", "medium", "large-v3", "turbo"),
+    ),
+    "qwen3-asr": ("Qwen3-ASR", ("0.6B", "1.7B")),
+}
+
 
 class ASRRegistry:
     """Central registry for all ASR backends.
@@ -15,14 +38,36 @@ class ASRRegistry:
     """
 
     _registry: dict[str, Type[ASRBase]] = {}
+    _types_cache: Optional[list[str]] = None
 
     @classmethod
     def register(cls, asr_class: Type[ASRBase]) -> Type[ASRBase]:
         """Register an ASR class. Can also be used as a decorator."""
         key = asr_class.name().lower()
+        existing = cls._registry.get(key)
+        if existing is not None and existing is not asr_class:
+            raise ValueError(
+                f"ASR type '{key}' is already registered by "
+                f"{existing.__module__}.{existing.__qualname__}"
+            )
         cls._registry[key] = asr_class
+        cls._types_cache = None
         return asr_class
 
+    @classmethod
+    def _resolve(cls, asr_type: str) -> str:
+        """Normalize *asr_type* to a registry key, importing its backend.
+
+        Keys are stored lowercase already, so the common case is a plain
+        dict hit without paying for ``str.lower``.
+        """
+        key = asr_type
+        if key not in cls._registry and key not in _LAZY_BACKENDS:
+            key = asr_type.lower()
+        if key not in cls._registry and key in _LAZY_BACKENDS:
+            importlib.import_module(_LAZY_BACKENDS[key])
+        return key
+
     @classmethod
     def create(
         cls,
@@ -33,7 +78,7 @@ class ASRRegistry:
         config: Optional[dict] = None,
     ) -> ASRBase:
         """Instantiate an ASR backend by its registered name."""
-        key = asr_type.lower()
+        key = cls._resolve(asr_type)
         if key not in cls._registry:
             available = ", ".join(cls._registry.keys())
             raise ValueError(
@@ -48,21 +93,41 @@ class ASRRegistry:
 
     @classmethod
     def list_types(cls) -> list[str]:
-        """Return registered ASR type names."""
-        return list(cls._registry.keys())
+        """Return known ASR type names (without importing backend modules)."""
+        if cls._types_cache is None:
+            cls._types_cache = list(dict.fromkeys([*_LAZY_BACKENDS, *cls._registry]))
+        return list(cls._types_cache)
 
     @classmethod
     def get_model_sizes(cls, asr_type: str) -> list[str]:
-        """Return available model sizes for a given ASR type."""
-        key = asr_type.lower()
+        """Return available model sizes for a given ASR type.
+
+        Answered from the metadata table when possible so UI population
+        does not import the backend module.
+        """
+        key = asr_type if asr_type in _BACKEND_INFO else asr_type.lower()
+        if key in cls._registry:
+            return cls._registry[key].available_model_sizes()
+        if key in _BACKEND_INFO:
+            return list(_BACKEND_INFO[key][1])
+        key = cls._resolve(asr_type)
         if key not in cls._registry:
             return []
         return cls._registry[key].available_model_sizes()
 
     @classmethod
     def get_display_name(cls, asr_type: str) -> str:
-        """Return the human-readable display name for an ASR type."""
-        key = asr_type.lower()
+        """Return the human-readable display name for an ASR type.
+
+        Answered from the metadata table when possible so UI population
+        does not import the backend module.
+        """
+        key = asr_type if asr_type in _BACKEND_INFO else asr_type.lower()
+        if key in cls._registry:
+            return cls._registry[key].name()
+        if key in _BACKEND_INFO:
+            return _BACKEND_INFO[key][0]
+        key = cls._resolve(asr_type)
         if key in cls._registry:
             return cls._registry[key].name()
         return asr_type
@@ -43,18 +43,22 @@ class WhisperASR(ASRBase):
 
     def transcribe(
         self,
-        audio_path: str,
+        audio,
         language: Optional[str] = None,
     ) -> list[TranscriptionSegment]:
         if self._model is None:
             raise RuntimeError("Model not loaded. Call load_model() first.")
 
-        logger.debug(f"Whisper transcribing: {audio_path}")
+        # Positional args defer formatting until the sink actually emits
+        logger.debug(
+            "Whisper transcribing: {}",
+            audio if isinstance(audio, str) else "<in-memory audio>",
+        )
         opts: dict = {"word_timestamps": True}
         if language and language != "auto":
             opts["language"] = language
 
-        result = self._model.transcribe(audio_path, **opts)
+        result = self._model.transcribe(audio, **opts)
 
         segments: list[TranscriptionSegment] = []
         for seg in result.get("segments", []):
@@ -75,7 +79,7 @@ class WhisperASR(ASRBase):
                     words=words,
                 )
             )
-        logger.debug(f"Whisper returned {len(segments)} segment(s).")
+        logger.debug("Whisper returned {} segment(s).", len(segments))
         return segments
 
     def unload_model(self) -> None:
@@ -6,6 +6,9 @@ DEFAULTS: dict = {
         "model_size": "turbo",
         "device": "cpu",
         "language": "zh",
+        "quantization": "none",  # "none" | "8bit" | "4bit" (GPU only)
+        "dtype": "auto",  # "auto" | "float32" | "float16" | "bfloat16"
+        "batch_size": 8,  # segments per transcribe_batch call
     },
     "vad": {
         "threshold": 0.5,
@@ -32,9 +35,11 @@ DEFAULTS: dict = {
         "enabled": False,
         "target_language": "en",
         "model_size": "4b",
+        "quantization": "none",  # "none" | "8bit" | "4bit" (GPU only)
     },
     "huggingface": {
         "endpoint": "",  # Default: use official, "" means official
+        "prefetch": False,  # download the configured ASR model in the background at startup
     },
 }
 
@@ -2,16 +2,40 @@
 
 from __future__ import annotations
 
-import copy
 import json
 import os
 import platform
 import threading
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Optional
 
 from src.config.defaults import DEFAULTS
 
+try:
+    import orjson  # optional: ~5-10x faster (de)serialization
+except ImportError:
+    orjson = None
+
+# Serialized once at import; settings are JSON by construction, and the
+# C-accelerated json codec deep-copies plain dicts faster than copy.deepcopy.
+_DEFAULTS_JSON: str = json.dumps(DEFAULTS)
+
+
+def _json_copy(obj: dict) -> dict:
+    """Deep-copy a JSON-serializable dict via a json round-trip."""
+    return json.loads(json.dumps(obj))
+
+
+@lru_cache(maxsize=512)
+def _split_path(key_path: str) -> tuple[str, ...]:
+    """Split (and cache) a dot-notation key path.
+
+    The UI reads the same handful of keys over and over; caching the split
+    avoids re-allocating the key list on every access.
+    """
+    return tuple(key_path.split("."))
+
 
 def _get_config_dir() -> Path:
     """Return the platform-appropriate configuration directory."""
@@ -36,68 +60,105 @@ class SettingsManager:
             self._path = _get_config_dir() / "settings.json"
         self._lock = threading.Lock()
         self._data: dict = {}
+        # Read-only copy of _data, republished by writers. Readers walk it
+        # without taking the lock: attribute assignment is atomic and the
+        # snapshot itself is never mutated after publication.
+        self._snapshot: dict = {}
         self.load()
 
     def load(self) -> dict:
         """Load settings from disk, merging with defaults."""
         with self._lock:
-            self._data = copy.deepcopy(DEFAULTS)
+            self._data = json.loads(_DEFAULTS_JSON)
             if self._path.exists():
                 try:
-                    with open(self._path, "r", encoding="utf-8") as f:
-                        user_data = json.load(f)
+                    raw = self._path.read_bytes()
+                    user_data = orjson.loads(raw) if orjson else json.loads(raw)
                     self._deep_merge(self._data, user_data)
-                except (json.JSONDecodeError, OSError):
+                except (ValueError, OSError):
                     pass  # corrupted file -> use defaults
-            return copy.deepcopy(self._data)
+            self._snapshot = _json_copy(self._data)
+            return _json_copy(self._data)
 
     def save(self) -> None:
         """Persist current settings to disk."""
         with self._lock:
             self._path.parent.mkdir(parents=True, exist_ok=True)
-            with open(self._path, "w", encoding="utf-8") as f:
-                json.dump(self._data, f, indent=2, ensure_ascii=False)
+            if orjson:
+                self._path.write_bytes(
+                    orjson.dumps(self._data, option=orjson.OPT_INDENT_2)
+                )
+            else:
+                with open(self._path, "w", encoding="utf-8") as f:
+                    json.dump(self._data, f, indent=2, ensure_ascii=False)
 
     def get(self, key_path: str, default: Any = None) -> Any:
-        """Get a value using dot-notation path, e.g. 'vad.threshold'."""
-        with self._lock:
-            keys = key_path.split(".")
-            node = self._data
-            for key in keys:
-                if isinstance(node, dict) and key in node:
-                    node = node[key]
-                else:
-                    return default
-            return node
+        """Get a value using dot-notation path, e.g. 'vad.threshold'.
 
-    def set(self, key_path: str, value: Any) -> None:
-        """Set a value using dot-notation path, then auto-save."""
+        Lock-free: reads walk the immutable snapshot, so hot-path lookups
+        never contend with writers.
+        """
+        node: Any = self._snapshot
+        for key in _split_path(key_path):
+            if isinstance(node, dict) and key in node:
+                node = node[key]
+            else:
+                return default
+        return node
+
+    def update(self, key_path: str, value: Any) -> None:
+        """Set a value using dot-notation path without touching disk.
+
+        Callers batching several keys (e.g. the UI auto-save) update them
+        all in memory and then persist once via :meth:`save` — ideally off
+        the interactive thread.
+        """
         with self._lock:
-            keys = key_path.split(".")
+            keys = _split_path(key_path)
             node = self._data
             for key in keys[:-1]:
                 if key not in node or not isinstance(node[key], dict):
                     node[key] = {}
                 node = node[key]
             node[keys[-1]] = value
+            self._snapshot = _json_copy(self._data)
+
+    def set(self, key_path: str, value: Any) -> None:
+        """Set a value using dot-notation path, then auto-save."""
+        self.update(key_path, value)
         self.save()
 
     def get_all(self) -> dict:
         """Return a deep copy of all settings."""
-        with self._lock:
-            return copy.deepcopy(self._data)
+        return _json_copy(self._snapshot)
+
+    def snapshot(self) -> dict:
+        """Return the current immutable snapshot without copying.
+
+        Callers must treat it (and every nested dict) as read-only;
+        overrides belong in shallow-merged copies, not in-place writes.
+        """
+        return self._snapshot
 
     def reset(self) -> None:
         """Reset all settings to defaults and save."""
         with self._lock:
-            self._data = copy.deepcopy(DEFAULTS)
+            self._data = json.loads(_DEFAULTS_JSON)
+            self._snapshot = _json_copy(self._data)
         self.save()
 
     @staticmethod
     def _deep_merge(base: dict, override: dict) -> None:
-        """Recursively merge override into base (in-place)."""
-        for key, value in override.items():
-            if key in base and isinstance(base[key], dict) and isinstance(value, dict):
-                SettingsManager._deep_merge(base[key], value)
-            else:
-                base[key] = value
+        """Merge override into base (in-place), iteratively.
+
+        An explicit stack avoids Python call overhead per nested dict and
+        can't hit the recursion limit on pathological inputs.
+        """
+        stack = [(base, override)]
+        while stack:
+            dst, src = stack.pop()
+            for key, value in src.items():
+                if key in dst and isinstance(dst[key], dict) and isinstance(value, dict):
+                    stack.append((dst[key], value))
+                else:
+                    dst[key] = value
@@ -3,23 +3,25 @@
 from __future__ import annotations
 
 import os
+import queue
 import shutil
 import threading
+import time
 import traceback
+# The stdlib cancellation exception doubles as ours: no custom class to
+# import everywhere cancellation is checked
+from concurrent.futures import CancelledError as CancelledException
+from dataclasses import replace
 from typing import Callable, Optional
 
 from loguru import logger
 
-from src.asr import ASRRegistry
+from src.asr import ASRBase, ASRRegistry
 from src.core.audio_processor import AudioProcessor
 from src.core.speaker_diarizer import SpeakerDiarizer
 from src.core.subtitle_generator import SubtitleGenerator
 from src.core.vad_processor import VADProcessor
-from src.models.datatypes import (
-    CancelledException,
-    SubtitleEntry,
-    TranscriptionSegment,
-)
+from src.models.datatypes import SubtitleEntry, TranscriptionSegment
 
 # Type alias for the progress callback: (step_name, percent_0_100, detail_message)
 ProgressCallback = Callable[[str, float, str], None]
@@ -42,6 +44,10 @@ class SubtitlePipeline:
         self._cancelled = threading.Event()
         self._partial_results: list[SubtitleEntry] = []
         self._temp_files: list[str] = []
+        self._producer: Optional[threading.Thread] = None
+        self._loader: Optional[threading.Thread] = None
+        self._load_errors: list[BaseException] = []
+        self._asr_engine: Optional[ASRBase] = None
 
     # ------------------------------------------------------------------
     # Public API
@@ -65,6 +71,35 @@ class SubtitlePipeline:
             self._save_partial(csv_output)
             raise
         finally:
+            # Unstick any batch producer still looping on the bounded
+            # queue: when the consumer dies on an exception nothing drains
+            # the queue anymore, and _put_until_cancelled only gives up
+            # once this event is set. The join reaps the thread so a
+            # failed run doesn't pin the sliced audio for the process
+            # lifetime.
+            self._cancelled.set()
+            if self._producer is not None:
+                self._producer.join(timeout=5.0)
+                self._producer = None
+            # Any exit before Step 5 (error, cancel, no speech detected)
+            # leaves the warm loader mid-flight with a multi-GB model on
+            # the way. Wait for it — load_model can't be interrupted —
+            # so a cancel+retry never runs two loads at once, then
+            # surface its error and release whatever it did load.
+            if self._loader is not None:
+                self._loader.join()
+                self._loader = None
+            if self._load_errors:
+                logger.error(
+                    "Background model load failed: {}", self._load_errors[0]
+                )
+                self._load_errors.clear()
+            if self._asr_engine is not None:
+                try:
+                    self._asr_engine.unload_model()
+                except Exception as e:
+                    logger.warning(f"Failed to unload ASR model: {e}")
+                self._asr_engine = None
             self._cleanup()
 
     def cancel(self) -> None:
@@ -89,36 +124,56 @@ class SubtitlePipeline:
         diar_cfg = self._config.get("diarization", {})
         paths_cfg = self._config.get("paths", {})
 
-        # Use project-local temp/ directory
-        project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-        tmp_base = os.path.join(project_root, "temp")
-        os.makedirs(tmp_base, exist_ok=True)
-        # Create a unique sub-directory for this run
-        import time
-        tmp_dir = os.path.join(tmp_base, f"run_{int(time.time() * 1000)}")
-        os.makedirs(tmp_dir, exist_ok=True)
+        # -- Step 0: Warm-load models in the background ---------------------
+        # Model loading (checkpoint download + deserialization) overlaps the
+        # audio extraction/enhancement/VAD stages instead of serializing
+        # after them. Errors surface when the ASR step joins the thread.
+        model_dir = paths_cfg.get("model_dir", "") or None
+        asr_engine = ASRRegistry.create(
+            asr_type=asr_cfg.get("type", "whisper"),
+            model_size=asr_cfg.get("model_size", "turbo"),
+            device=asr_cfg.get("device", "cpu"),
+            model_dir=model_dir,
+            config=self._config,
+        )
+        diarizer = SpeakerDiarizer() if diar_cfg.get("enabled", False) else None
+
+        def _warm_load() -> None:
+            try:
+                asr_engine.load_model()
+                if diarizer is not None:
+                    diarizer._ensure_model()
+            except BaseException as e:  # re-raised on join
+                self._load_errors.append(e)
+
+        # The engine and thread live on self so process()'s finally can
+        # still observe the load on early returns and error paths.
+        self._asr_engine = asr_engine
+        self._loader = threading.Thread(
+            target=_warm_load, name="model-warm-load", daemon=True
+        )
+        self._loader.start()
 
         # -- Step 1: Extract audio ----------------------------------------
+        # The whole run stays in memory: ffmpeg pipes decoded samples in,
+        # enhancement transforms the array, VAD/ASR/diarization slice it.
         self._check_cancelled()
         self._progress("extract", 0, "正在提取音频...")
         ap = AudioProcessor()
-        raw_audio = os.path.join(tmp_dir, "raw_audio.wav")
-        self._temp_files.append(raw_audio)
-        ap.extract_audio(input_path, raw_audio)
+        sr = 16000
+        audio_data = ap.extract_audio_array(input_path, sample_rate=sr)
         self._progress("extract", 5, "音频提取完成")
 
         # -- Step 2: Enhance audio ----------------------------------------
         self._check_cancelled()
         self._progress("enhance", 5, "正在增强人声...")
-        enhanced_audio = os.path.join(tmp_dir, "enhanced.wav")
-        self._temp_files.append(enhanced_audio)
-        ap.enhance_audio(
-            raw_audio,
-            enhanced_audio,
+        audio_data = ap.enhance_audio_array(
+            audio_data,
+            sr,
             enable_noise_reduce=audio_cfg.get("enable_noise_reduce", True),
             enable_bandpass=audio_cfg.get("enable_bandpass", True),
         )
-        audio_duration = ap.get_duration(enhanced_audio)
+        audio_duration = len(audio_data) / sr
         self._progress("enhance", 10, "音频增强完成")
 
         # -- Step 3: VAD ---------------------------------------------------
@@ -130,7 +185,7 @@ class SubtitlePipeline:
             min_speech_duration_ms=vad_cfg.get("min_speech_duration_ms", 250),
             speech_pad_ms=vad_cfg.get("speech_pad_ms", 30),
         )
-        raw_segments = vad.detect_speech(enhanced_audio)
+        raw_segments = vad.detect_speech(audio_data)
         self._progress("vad", 15, f"检测到 {len(raw_segments)} 个语音片段")
 
         # -- Step 4: Expand + merge segments --------------------------------
@@ -156,65 +211,122 @@ class SubtitlePipeline:
         # -- Step 5: ASR transcription per segment --------------------------
         self._check_cancelled()
         self._progress("asr", 20, "正在加载 ASR 模型...")
-
-        model_dir = paths_cfg.get("model_dir", "") or None
-        asr_engine = ASRRegistry.create(
-            asr_type=asr_cfg.get("type", "whisper"),
-            model_size=asr_cfg.get("model_size", "turbo"),
-            device=asr_cfg.get("device", "cpu"),
-            model_dir=model_dir,
-            config=self._config,
-        )
-        asr_engine.load_model()
+        self._loader.join()
+        self._loader = None
+        if self._load_errors:
+            raise self._load_errors.pop()
         self._progress("asr", 25, "ASR 模型加载完成，开始识别...")
 
         language = asr_cfg.get("language", "zh")
+        batch_size = max(1, int(asr_cfg.get("batch_size", 8)))
         all_transcriptions: list[TranscriptionSegment] = []
         asr_start_pct = 25.0
         asr_end_pct = 85.0
 
-        for i, seg in enumerate(segments):
+        max_chars = sub_cfg.get("max_chars_per_subtitle", 30)
+        gen_partial = SubtitleGenerator(max_chars=max_chars)
+        last_partial = 0.0
+
+        # A small bounded queue lets batch preparation run ahead of the model
+        # on a producer thread, so transcription never waits on slicing.
+        batch_queue: queue.Queue = queue.Queue(maxsize=2)
+
+        produce_errors: list[BaseException] = []
+
+        def _produce_batches() -> None:
+            # The sentinel is sent from the finally so the consumer wakes
+            # even when slicing raises; the error itself is re-raised on
+            # the consumer side once the queue drains.
+            try:
+                for batch_start in range(0, len(segments), batch_size):
+                    batch = segments[batch_start:batch_start + batch_size]
+                    clips = [
+                        audio_data[int(s.start_time * sr):int(s.end_time * sr)]
+                        for s in batch
+                    ]
+                    if not self._put_until_cancelled(
+                        batch_queue, (batch_start, batch, clips)
+                    ):
+                        return
+            except BaseException as e:  # re-raised after the consumer loop
+                produce_errors.append(e)
+            finally:
+                self._put_until_cancelled(batch_queue, None)
+
+        producer = threading.Thread(
+            target=_produce_batches, name="asr-batch-producer", daemon=True
+        )
+        self._producer = producer
+        producer.start()
+
+        while True:
+            # Timed get: a cancel can land while the queue is empty, in
+            # which case _put_until_cancelled gives up before the sentinel
+            # is ever enqueued — the consumer must wake up on its own.
+            try:
+                item = batch_queue.get(timeout=0.5)
+            except queue.Empty:
+                self._check_cancelled()
+                continue
+            if item is None:
+                break
             self._check_cancelled()
-            pct = asr_start_pct + (asr_end_pct - asr_start_pct) * (i / len(segments))
+            batch_start, batch, clips = item
+            pct = asr_start_pct + (asr_end_pct - asr_start_pct) * (
+                batch_start / len(segments)
+            )
             self._progress(
                 "asr",
                 pct,
-                f"正在识别语音片段 {i + 1}/{len(segments)}...",
+                f"正在识别语音片段 {batch_start + 1}-"
+                f"{batch_start + len(batch)}/{len(segments)}...",
             )
 
-            # Extract the segment audio to a temp file
-            seg_audio = os.path.join(tmp_dir, f"seg_{i}.wav")
-            self._temp_files.append(seg_audio)
-            self._extract_segment(enhanced_audio, seg_audio, seg.start_time, seg.end_time)
-
-            trans = asr_engine.transcribe(seg_audio, language=language)
-
-            # Offset timestamps by segment start_time (ASR timestamps are relative to segment)
-            for t in trans:
-                t.start_time += seg.start_time
-                t.end_time += seg.start_time
-                for w in t.words:
-                    w.start += seg.start_time
-                    w.end += seg.start_time
+            batch_results = asr_engine.transcribe_batch(clips, language=language)
+
+            for seg, trans in zip(batch, batch_results):
+                # Offset timestamps by segment start_time (ASR timestamps are
+                # relative to segment). The dataclasses are frozen, so the
+                # shifted copies are built with dataclasses.replace.
+                offset = seg.start_time
+                all_transcriptions.extend(
+                    replace(
+                        t,
+                        start_time=t.start_time + offset,
+                        end_time=t.end_time + offset,
+                        words=[
+                            replace(w, start=w.start + offset, end=w.end + offset)
+                            for w in t.words
+                        ],
+                    )
+                    for t in trans
+                )
 
-            all_transcriptions.extend(trans)
+            # Update partial results (for cancel-safety). Each rebuild walks
+            # every transcription so far, so throttle it to every couple of
+            # seconds instead of every batch.
+            now = time.monotonic()
+            if now - last_partial >= 2.0:
+                self._partial_results = gen_partial.generate(all_transcriptions)
+                last_partial = now
 
-            # Update partial results (for cancel-safety)
-            max_chars = sub_cfg.get("max_chars_per_subtitle", 30)
-            gen_tmp = SubtitleGenerator(max_chars=max_chars)
-            self._partial_results = gen_tmp.generate(all_transcriptions)
+        if produce_errors:
+            raise produce_errors[0]
 
+        self._partial_results = gen_partial.generate(all_transcriptions)
         asr_engine.unload_model()
+        self._asr_engine = None
         self._progress("asr", 85, f"ASR 识别完成，共 {len(all_transcriptions)} 个片段")
 
         # -- Step 6: Speaker diarization (optional) -------------------------
         speaker_map: Optional[dict[int, str]] = None
-        if diar_cfg.get("enabled", False):
+        if diarizer is not None:
             self._check_cancelled()
             self._progress("diarization", 85, "正在进行说话人分离...")
             try:
-                diarizer = SpeakerDiarizer()
-                speaker_map = diarizer.identify_speakers(enhanced_audio, segments)
+                speaker_map = diarizer.identify_speakers(
+                    audio_data, segments, sample_rate=sr
+                )
                 self._progress("diarization", 92, "说话人分离完成")
             except Exception as e:
                 logger.error(f"Speaker diarization failed: {e}. Continuing without it.")
@@ -237,7 +349,10 @@ class SubtitlePipeline:
             self._progress("translation", 95, "正在翻译字幕...")
             try:
                 from src.core.translator import SubtitleTranslator
-                translator = SubtitleTranslator(model_size=trans_cfg.get("model_size", "4b"))
+                translator = SubtitleTranslator(
+                    model_size=trans_cfg.get("model_size", "4b"),
+                    quantization=trans_cfg.get("quantization", "none"),
+                )
                 translator.load_model()
                 
                 # Create translated SRT file path using target language code instead of '_translated'
@@ -271,6 +386,20 @@ class SubtitlePipeline:
         if self._cancelled.is_set():
             raise CancelledException("User cancelled the operation.")
 
+    def _put_until_cancelled(self, q: queue.Queue, item) -> bool:
+        """Put *item* on *q*, giving up when the pipeline is cancelled.
+
+        Returns False on cancellation so producer threads can exit instead
+        of blocking forever on a full queue that nobody drains anymore.
+        """
+        while not self._cancelled.is_set():
+            try:
+                q.put(item, timeout=0.5)
+                return True
+            except queue.Full:
+                continue
+        return False
+
     def _save_partial(self, csv_output: str) -> None:
         """Save whatever results we have so far."""
         if self._partial_results:
@@ -285,23 +414,6 @@ class SubtitlePipeline:
         else:
             logger.info("No partial results to save.")
 
-    @staticmethod
-    def _extract_segment(
-        audio_path: str,
-        output_path: str,
-        start_s: float,
-        end_s: float,
-    ) -> None:
-        """Extract a time range from an audio file using soundfile."""
-        import soundfile as sf
-
-        info = sf.info(audio_path)
-        sr = info.samplerate
-        start_frame = int(start_s * sr)
-        num_frames = int((end_s - start_s) * sr)
-        data, _ = sf.read(audio_path, start=start_frame, frames=num_frames, dtype="float32")
-        sf.write(output_path, data, sr, subtype="PCM_16")
-
     def _cleanup(self) -> None:
         """Remove temporary files and directories."""
         tmp_dirs: set[str] = set()
@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
+import hashlib
 import string
-import tempfile
+from bisect import bisect_left
 from pathlib import Path
 from typing import Optional
 
@@ -13,6 +14,11 @@ from loguru import logger
 
 from src.models.datatypes import SpeechSegment
 
+# On-disk embedding cache, keyed by a digest of the raw chunk samples.
+# Re-running diarization on the same media (e.g. after tweaking subtitle
+# settings) then skips the model entirely.
+_EMBEDDING_CACHE_DIR = Path.home() / ".cache" / "subtitle_extractor" / "embeddings"
+
 
 class SpeakerDiarizer:
     """Identify speakers in audio segments using CAM++ embeddings + clustering."""
@@ -31,16 +37,19 @@ class SpeakerDiarizer:
 
     def identify_speakers(
         self,
-        audio_path: str,
+        audio: str | np.ndarray,
         segments: list[SpeechSegment],
         num_speakers: Optional[int] = None,
+        sample_rate: Optional[int] = None,
     ) -> dict[int, str]:
         """Extract embeddings per segment and cluster into speaker identities.
 
         Args:
-            audio_path: path to the full audio file (16 kHz mono WAV).
+            audio: path to the full audio file (16 kHz mono WAV), or the
+                decoded float32 samples themselves.
             segments: speech segments (matching the order of transcription segments).
             num_speakers: if provided, force this many clusters; otherwise auto-detect.
+            sample_rate: sample rate of ``audio`` when it is an array.
 
         Returns:
             Mapping from segment index to speaker label ("A", "B", "C", ...).
@@ -51,21 +60,32 @@ class SpeakerDiarizer:
             return {}
 
         logger.info(f"Extracting speaker embeddings for {len(segments)} segment(s)...")
-        full_audio, sr = sf.read(audio_path, dtype="float32")
+        if isinstance(audio, str):
+            full_audio, sr = sf.read(audio, dtype="float32")
+        else:
+            full_audio, sr = audio, sample_rate or 16000
+
+        # Vectorized boundary math: sample offsets and the too-short mask
+        # (< 0.1s) are computed for all segments at once
+        n_seg = len(segments)
+        starts = np.fromiter(
+            (seg.start_time for seg in segments), dtype=np.float64, count=n_seg
+        )
+        ends = np.fromiter(
+            (seg.end_time for seg in segments), dtype=np.float64, count=n_seg
+        )
+        start_samples = (starts * sr).astype(np.int64)
+        end_samples = np.minimum((ends * sr).astype(np.int64), len(full_audio))
+        valid_mask = (end_samples - start_samples) >= int(sr * 0.1)
+
+        chunk_indices = np.flatnonzero(valid_mask).tolist()
+        chunks = [
+            full_audio[start_samples[idx]:end_samples[idx]] for idx in chunk_indices
+        ]
 
         embeddings: list[np.ndarray] = []
         valid_indices: list[int] = []
-
-        for idx, seg in enumerate(segments):
-            start_sample = int(seg.start_time * sr)
-            end_sample = int(seg.end_time * sr)
-            chunk = full_audio[start_sample:end_sample]
-
-            if len(chunk) < sr * 0.1:
-                # Skip very short segments (< 0.1s)
-                continue
-
-            emb = self._extract_embedding(chunk, sr)
+        for idx, emb in zip(chunk_indices, self._extract_embeddings(chunks, sr)):
             if emb is not None:
                 embeddings.append(emb)
                 valid_indices.append(idx)
@@ -97,36 +117,103 @@ class SpeakerDiarizer:
             result[seg_idx] = label_map[labels[valid_idx]]
 
         # For segments that were skipped (too short), assign the nearest speaker
+        known = sorted(result)
         for idx in range(len(segments)):
             if idx not in result:
-                result[idx] = self._nearest_speaker(idx, result)
+                result[idx] = result[self._nearest_known(idx, known)]
 
         n_speakers = len(set(result.values()))
         logger.info(f"Speaker diarization complete: {n_speakers} speaker(s) detected.")
         return result
 
+    def _extract_embeddings(
+        self, chunks: list[np.ndarray], sr: int
+    ) -> list[Optional[np.ndarray]]:
+        """Extract speaker embeddings, serving repeats from the disk cache.
+
+        Chunks whose sha256 digest is already cached are loaded with
+        np.load; only the misses go through the model.
+        """
+        if not chunks:
+            return []
+
+        keys = [
+            hashlib.sha256(np.ascontiguousarray(chunk).tobytes()).hexdigest()
+            for chunk in chunks
+        ]
+        results: list[Optional[np.ndarray]] = [None] * len(chunks)
+        misses: list[int] = []
+        for i, key in enumerate(keys):
+            path = _EMBEDDING_CACHE_DIR / f"{key}.npy"
+            if path.exists():
+                try:
+                    results[i] = np.load(path)
+                    continue
+                except Exception:
+                    pass  # unreadable entry -> recompute
+            misses.append(i)
+
+        if misses:
+            computed = self._generate_embeddings([chunks[i] for i in misses], sr)
+            for i, emb in zip(misses, computed):
+                results[i] = emb
+                if emb is not None:
+                    try:
+                        _EMBEDDING_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                        np.save(_EMBEDDING_CACHE_DIR / f"{keys[i]}.npy", emb)
+                    except OSError:
+                        pass  # cache is best-effort
+        return results
+
+    def _generate_embeddings(
+        self, chunks: list[np.ndarray], sr: int
+    ) -> list[Optional[np.ndarray]]:
+        """Run the model over all chunks in one batched call.
+
+        funasr accepts a list of inputs and batches the forward passes;
+        if the batched call fails, fall back to one call per chunk so a
+        single bad segment can't sink the whole run.
+        """
+        if not chunks:
+            return []
+        try:
+            res = self._model.generate(input=chunks, fs=sr)
+            if res and len(res) == len(chunks):
+                return [self._embedding_from_result(r) for r in res]
+            logger.warning(
+                "Batched embedding extraction returned "
+                f"{len(res) if res else 0}/{len(chunks)} results; "
+                "falling back to per-segment calls."
+            )
+        except Exception as e:
+            logger.warning(
+                f"Batched embedding extraction failed ({e}); "
+                "falling back to per-segment calls."
+            )
+        return [self._extract_embedding(chunk, sr) for chunk in chunks]
+
     def _extract_embedding(
         self, audio_chunk: np.ndarray, sr: int
     ) -> Optional[np.ndarray]:
         """Extract a speaker embedding for a single audio chunk."""
         try:
-            # Write chunk to a temporary WAV file for funasr
-            with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
-                tmp_path = tmp.name
-                sf.write(tmp_path, audio_chunk, sr, subtype="PCM_16")
-
-            res = self._model.generate(input=tmp_path)
-
-            Path(tmp_path).unlink(missing_ok=True)
+            # funasr accepts raw samples directly; no temp WAV round-trip
+            res = self._model.generate(input=audio_chunk, fs=sr)
 
             if res and len(res) > 0:
-                emb = res[0].get("spk_embedding", None)
-                if emb is None:
-                    emb = res[0].get("embedding", None)
-                if emb is not None:
-                    return np.array(emb, dtype=np.float32).flatten()
+                return self._embedding_from_result(res[0])
         except Exception as e:
-            logger.warning(f"Embedding extraction failed for a segment: {e}")
+            logger.warning("Embedding extraction failed for a segment: {}", e)
+        return None
+
+    @staticmethod
+    def _embedding_from_result(result: dict) -> Optional[np.ndarray]:
+        """Pull the embedding vector out of a funasr result entry."""
+        emb = result.get("spk_embedding", None)
+        if emb is None:
+            emb = result.get("embedding", None)
+        if emb is not None:
+            return np.array(emb, dtype=np.float32).flatten()
         return None
 
     @staticmethod
@@ -138,57 +225,101 @@ class SpeakerDiarizer:
         from sklearn.cluster import AgglomerativeClustering
         from sklearn.metrics import silhouette_score
 
+        # Ward linkage on L2-normalized embeddings: on the unit sphere,
+        # euclidean distance is monotone in cosine distance, and ward yields
+        # better-balanced speaker clusters than average linkage
+        norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+        embeddings = embeddings / np.maximum(norms, 1e-10)
+
         if num_speakers is not None and num_speakers > 0:
             model = AgglomerativeClustering(
-                n_clusters=num_speakers, metric="cosine", linkage="average"
+                n_clusters=num_speakers, linkage="ward"
             )
             labels = model.fit_predict(embeddings)
             return labels.tolist()
 
-        # Auto-detect number of speakers: try 2..min(10, n_samples-1) and pick best silhouette
-        # Ensure we don't try to cluster more groups than samples
+        # Auto-detect number of speakers
         max_k = min(10, len(embeddings) - 1)
         if max_k < 2:
             # If we have less than 2 valid samples for clustering, return all as same speaker
             return [0] * len(embeddings)
 
-        best_k = 2
-        best_score = -1.0
-        
-        # Only try clustering if we have enough samples
-        for k in range(2, max_k + 1):
-            if k > len(embeddings):
-                break  # Cannot cluster more groups than samples
-            try:
-                model = AgglomerativeClustering(
-                    n_clusters=k, metric="cosine", linkage="average"
-                )
-                labels = model.fit_predict(embeddings)
-                if len(set(labels)) < 2:
+        # With enough samples, estimate k from the eigengap of the affinity
+        # spectrum: one eigendecomposition instead of clustering + scoring
+        # the whole matrix once per candidate k.
+        best_k = None
+        if len(embeddings) >= 10:
+            best_k = SpeakerDiarizer._eigengap_k(embeddings, max_k)
+            if best_k == 1:
+                return [0] * len(embeddings)
+
+        if best_k is None:
+            # Small sample counts (or eigengap failure): sweep candidate k
+            # values and keep the best silhouette score
+            best_k = 2
+            best_score = -1.0
+            for k in range(2, max_k + 1):
+                if k > len(embeddings):
+                    break  # Cannot cluster more groups than samples
+                try:
+                    model = AgglomerativeClustering(n_clusters=k, linkage="ward")
+                    labels = model.fit_predict(embeddings)
+                    if len(set(labels)) < 2:
+                        continue
+                    score = silhouette_score(embeddings, labels, metric="euclidean")
+                    if score > best_score:
+                        best_score = score
+                        best_k = k
+                except Exception as e:
+                    logger.warning("Skipping clustering with {} clusters due to error: {}", k, e)
                     continue
-                score = silhouette_score(embeddings, labels, metric="cosine")
-                if score > best_score:
-                    best_score = score
-                    best_k = k
-            except Exception as e:
-                logger.warning(f"Skipping clustering with {k} clusters due to error: {e}")
-                continue
 
         # Final clustering - ensure we don't try to cluster more groups than samples
         final_k = min(best_k, len(embeddings))
         if final_k < 2:
             return [0] * len(embeddings)
             
-        model = AgglomerativeClustering(
-            n_clusters=final_k, metric="cosine", linkage="average"
-        )
+        model = AgglomerativeClustering(n_clusters=final_k, linkage="ward")
         labels = model.fit_predict(embeddings)
         return labels.tolist()
 
     @staticmethod
-    def _nearest_speaker(idx: int, speaker_map: dict[int, str]) -> str:
-        """For a missing index, return the speaker of the nearest known segment."""
-        if not speaker_map:
-            return "A"
-        nearest = min(speaker_map.keys(), key=lambda k: abs(k - idx))
-        return speaker_map[nearest]
+    def _eigengap_k(embeddings: np.ndarray, max_k: int) -> Optional[int]:
+        """Estimate the speaker count via the eigengap heuristic.
+
+        Builds a cosine affinity matrix, takes the spectrum of its
+        normalized Laplacian and picks k at the largest gap between
+        consecutive eigenvalues. Returns None if the estimate fails.
+        """
+        try:
+            norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+            normed = embeddings / np.maximum(norms, 1e-10)
+            affinity = np.clip(normed @ normed.T, 0.0, None)
+            np.fill_diagonal(affinity, 1.0)
+
+            degree = affinity.sum(axis=1)
+            d_inv = 1.0 / np.sqrt(np.maximum(degree, 1e-10))
+            laplacian = np.eye(len(affinity)) - d_inv[:, None] * affinity * d_inv[None, :]
+            eigvals = np.linalg.eigvalsh(laplacian)  # ascending
+
+            gaps = np.diff(eigvals[: max_k + 1])
+            return int(np.argmax(gaps)) + 1
+        except Exception as e:
+            logger.warning(f"Eigengap estimate failed ({e}); falling back.")
+            return None
+
+    @staticmethod
+    def _nearest_known(idx: int, known: list[int]) -> int:
+        """Return the member of sorted ``known`` closest to ``idx``.
+
+        Bisect makes filling the skipped segments O(m log n) instead of a
+        linear scan over the known indices per missing segment. Ties go to
+        the earlier segment.
+        """
+        pos = bisect_left(known, idx)
+        if pos == 0:
+            return known[0]
+        if pos == len(known):
+            return known[-1]
+        before, after = known[pos - 1], known[pos]
+        return after if after - idx < idx - before else before
@@ -11,12 +11,19 @@ from loguru import logger
 from src.models.datatypes import (
     SubtitleEntry,
     TranscriptionSegment,
+    WordArray,
     WordTimestamp,
 )
 
 # Sentence-ending punctuation (Chinese and Western)
 _SENTENCE_END_RE = re.compile(r"([。！？.!?]+)")
 
+# Trailing punctuation stripped when matching words back to sentence text
+_TRAIL_PUNCT_RE = re.compile(r"[。！？.!?,，、;；:]+$")
+
+# Natural break characters for splitting over-long text without word data
+_NAT_BREAK_RE = re.compile(r"[,，、 ]")
+
 
 class SubtitleGenerator:
     """Convert ASR transcription segments into properly split subtitle entries."""
@@ -27,11 +34,11 @@ class SubtitleGenerator:
     @staticmethod
     def _format_timestamp(seconds: float) -> str:
         """Format seconds as readable timestamp: HH:MM:SS.mmm"""
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        secs = int(seconds % 60)
-        millis = int(round((seconds - int(seconds)) * 1000))
-        return f"{hours:02d}:{minutes:02d}:{secs:02d}.{millis:03d}"
+        ms = int(seconds * 1000 + 0.5)
+        s, ms = divmod(ms, 1000)
+        m, s = divmod(s, 60)
+        h, m = divmod(m, 60)
+        return f"{h:02d}:{m:02d}:{s:02d}.{ms:03d}"
 
     def generate(
         self,
@@ -44,8 +51,19 @@ class SubtitleGenerator:
         2. Further split any piece exceeding *max_chars* at word boundaries.
         3. Assign speaker labels if *speaker_map* is provided.
         """
-        entries: list[SubtitleEntry] = []
-        index = 1
+        # Collect plain (start, end, text, speaker) tuples first; indices
+        # are assigned in one enumerate pass at the end, so the hot loop
+        # carries no counter and no dataclass construction
+        rows: list[tuple] = []
+        rows_append = rows.append
+        # Resolve the DEBUG filter once so the hot loop can skip timestamp
+        # formatting and log dispatch entirely when the sinks drop DEBUG.
+        # min_level lives on loguru's private core; if an upgrade ever
+        # moves it, fall back to emitting the logs rather than crashing.
+        try:
+            log_entries = logger._core.min_level <= logger.level("DEBUG").no
+        except AttributeError:
+            log_entries = True
 
         for seg_idx, seg in enumerate(segments):
             speaker = speaker_map.get(seg_idx) if speaker_map else None
@@ -61,23 +79,20 @@ class SubtitleGenerator:
                     sub_parts = [part]
 
                 for sp in sub_parts:
-                    if not sp.text.strip():
+                    text = sp.text.strip()
+                    if not text:
                         continue
-                    entry = SubtitleEntry(
-                        index=index,
-                        start_time=sp.start_time,
-                        end_time=sp.end_time,
-                        text=sp.text.strip(),
-                        speaker=speaker,
-                    )
-                    entries.append(entry)
-                    # Log the subtitle with timestamp and content
-                    start_ts = self._format_timestamp(entry.start_time)
-                    end_ts = self._format_timestamp(entry.end_time)
-                    speaker_prefix = f"[{entry.speaker}] " if entry.speaker else ""
-                    logger.info(f"[{start_ts} --> {end_ts}] {speaker_prefix}{entry.text}")
-                    index += 1
-
+                    rows_append((sp.start_time, sp.end_time, text, speaker))
+                    if log_entries:
+                        logger.debug(
+                            "[{} --> {}] {}{}",
+                            self._format_timestamp(sp.start_time),
+                            self._format_timestamp(sp.end_time),
+                            f"[{speaker}] " if speaker else "",
+                            text,
+                        )
+
+        entries = [SubtitleEntry(i, *row) for i, row in enumerate(rows, 1)]
         logger.info(f"Generated {len(entries)} subtitle entries.")
         return entries
 
@@ -93,23 +108,25 @@ class SubtitleGenerator:
         if not text:
             return []
 
-        # Find split points
-        parts = _SENTENCE_END_RE.split(text)
-        # Rejoin: ['今天天气很好', '。', '要不要出去玩', '？', '']
-        # -> ['今天天气很好。', '要不要出去玩？']
+        # Common case for short ASR chunks: no sentence punctuation at all.
+        # One C-level search that stops at the first hit beats building the
+        # sentence list just to find out there is nothing to split.
+        if not _SENTENCE_END_RE.search(text):
+            return [segment]
+
+        # One finditer pass: each match ends a sentence, so slicing up to
+        # m.end() keeps the punctuation attached without the interleaved
+        # list + rejoin loop that re.split would require
         sentences: list[str] = []
-        i = 0
-        while i < len(parts):
-            chunk = parts[i]
-            # Attach trailing punctuation
-            if i + 1 < len(parts) and _SENTENCE_END_RE.fullmatch(parts[i + 1]):
-                chunk += parts[i + 1]
-                i += 2
-            else:
-                i += 1
-            chunk = chunk.strip()
+        start = 0
+        for m in _SENTENCE_END_RE.finditer(text):
+            chunk = text[start:m.end()].strip()
             if chunk:
                 sentences.append(chunk)
+            start = m.end()
+        tail = text[start:].strip()
+        if tail:
+            sentences.append(tail)
 
         if len(sentences) <= 1:
             return [segment]
@@ -126,40 +143,54 @@ class SubtitleGenerator:
         segment: TranscriptionSegment,
         sentences: list[str],
     ) -> list[TranscriptionSegment]:
-        """Map sentence strings back to word timestamps for accurate time boundaries."""
+        """Map sentence strings back to word timestamps for accurate time boundaries.
+
+        Words are located in the full segment text with a single advancing
+        pointer, then bucketed into sentences by character range — one
+        linear pass instead of repeated substring searches and slices of
+        the shrinking sentence remainder.
+        """
+        text = segment.text
         results: list[TranscriptionSegment] = []
-        words = list(segment.words)
-        word_idx = 0
 
+        # Character range each sentence occupies in the original text
+        sentence_ranges: list[tuple[int, int]] = []
+        cursor = 0
         for sentence in sentences:
-            # Collect words that belong to this sentence
-            sentence_words: list[WordTimestamp] = []
-            remaining = sentence
-
-            while word_idx < len(words) and remaining:
-                w = words[word_idx]
-                clean_word = w.word.strip()
-                if not clean_word:
-                    word_idx += 1
-                    continue
-
-                # Check if this word appears in the remaining text
-                pos = remaining.find(clean_word)
+            pos = text.find(sentence, cursor)
+            if pos == -1:
+                pos = cursor
+            sentence_ranges.append((pos, pos + len(sentence)))
+            cursor = pos + len(sentence)
+
+        # Bucket words by the position they start at, advancing both
+        # pointers monotonically
+        buckets: list[list[WordTimestamp]] = [[] for _ in sentences]
+        cursor = 0
+        sent_idx = 0
+        for w in segment.words:
+            clean_word = w.word.strip()
+            if not clean_word:
+                continue
+
+            pos = text.find(clean_word, cursor)
+            if pos == -1:
+                # Try removing punctuation for matching
+                stripped = _TRAIL_PUNCT_RE.sub("", clean_word)
+                pos = text.find(stripped, cursor) if stripped else -1
                 if pos == -1:
-                    # Try removing punctuation for matching
-                    stripped = clean_word.rstrip("。！？.!?,，、;；:")
-                    pos = remaining.find(stripped) if stripped else -1
-
-                if pos != -1:
-                    sentence_words.append(w)
-                    # Advance remaining past this word
-                    end_pos = pos + len(clean_word)
-                    remaining = remaining[end_pos:].lstrip()
-                    word_idx += 1
-                else:
-                    # Word doesn't match – it likely belongs to the next sentence
-                    break
-
+                    continue  # word not locatable; leave it out of timing
+                clean_word = stripped
+
+            while (
+                sent_idx < len(sentence_ranges) - 1
+                and pos >= sentence_ranges[sent_idx][1]
+            ):
+                sent_idx += 1
+            buckets[sent_idx].append(w)
+            cursor = pos + len(clean_word)
+
+        for sentence, sentence_words in zip(sentences, buckets):
             if sentence_words:
                 start = sentence_words[0].start
                 end = sentence_words[-1].end
@@ -225,36 +256,33 @@ class SubtitleGenerator:
             # No word timestamps – split text evenly
             return self._split_text_evenly(segment, max_chars)
 
-        results: list[TranscriptionSegment] = []
-        current_words: list[WordTimestamp] = []
-        current_text = ""
-
-        for w in words:
-            candidate = current_text + w.word
-            if len(candidate.strip()) > max_chars and current_words:
-                results.append(
-                    TranscriptionSegment(
-                        start_time=current_words[0].start,
-                        end_time=current_words[-1].end,
-                        text=current_text.strip(),
-                        words=list(current_words),
-                    )
-                )
-                current_words = [w]
-                current_text = w.word
-            else:
-                current_words.append(w)
-                current_text = candidate
+        # SoA layout: one cumulative-length array up front, then each break
+        # point is a searchsorted instead of a per-word counter check, and
+        # boundary times come from the parallel start/end arrays
+        import numpy as np
+
+        wa = WordArray.from_words(words)
+        cumlen = np.cumsum(wa.lengths)
+        n = len(wa)
 
-        if current_words:
+        results: list[TranscriptionSegment] = []
+        cur = 0
+        base = 0
+        while cur < n:
+            # First word whose cumulative length would overflow the run;
+            # always take at least one word so over-long words still emit
+            nxt = int(np.searchsorted(cumlen, base + max_chars, side="right"))
+            nxt = min(max(nxt, cur + 1), n)
             results.append(
                 TranscriptionSegment(
-                    start_time=current_words[0].start,
-                    end_time=current_words[-1].end,
-                    text=current_text.strip(),
-                    words=list(current_words),
+                    start_time=float(wa.starts[cur]),
+                    end_time=float(wa.ends[nxt - 1]),
+                    text="".join(wa.texts[cur:nxt]).strip(),
+                    words=words[cur:nxt],
                 )
             )
+            base = int(cumlen[nxt - 1])
+            cur = nxt
 
         return results if results else [segment]
 
@@ -267,13 +295,16 @@ class SubtitleGenerator:
         text = segment.text
         chunks: list[str] = []
         while len(text) > max_chars:
-            # Try to find a natural break (comma, space)
-            split_pos = max_chars
-            for sep in (",", "，", " ", "、"):
-                pos = text.rfind(sep, 0, max_chars)
-                if pos > max_chars // 2:
-                    split_pos = pos + 1
-                    break
+            # Try to find a natural break (comma, space): one compiled scan
+            # over the window. Matches arrive in order, so only the final
+            # one matters — it is used when past the halfway point
+            last = None
+            for last in _NAT_BREAK_RE.finditer(text, 0, max_chars):
+                pass
+            if last is not None and last.start() > max_chars // 2:
+                split_pos = last.start() + 1
+            else:
+                split_pos = max_chars
             chunks.append(text[:split_pos].strip())
             text = text[split_pos:].strip()
         if text:
@@ -309,14 +340,15 @@ class SubtitleGenerator:
         with open(path, "w", newline="", encoding="utf-8-sig") as f:
             writer = csv.writer(f)
             writer.writerow(["start_time", "end_time", "speaker", "text"])
-            for entry in entries:
-                writer.writerow(entry.to_csv_row())
+            # writerows keeps the row loop on the C side
+            writer.writerows(entry.to_csv_row() for entry in entries)
 
     @staticmethod
     def export_srt(entries: list[SubtitleEntry], path: str) -> None:
         """Write subtitle entries to an SRT file."""
         logger.info(f"Exporting {len(entries)} entries to SRT: {path}")
+        # Assemble everything first and write once: export cost becomes I/O
+        # bandwidth instead of two f.write calls per entry
+        blocks = [entry.to_srt_block() for entry in entries]
         with open(path, "w", encoding="utf-8") as f:
-            for entry in entries:
-                f.write(entry.to_srt_block())
-                f.write("\n")
+            f.write("\n".join(blocks) + ("\n" if blocks else ""))
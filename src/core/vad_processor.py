@@ -2,13 +2,46 @@
 
 from __future__ import annotations
 
-import math
-
+import numpy as np
 from loguru import logger
 
 from src.models.datatypes import SpeechSegment
 
 
+def _split_long_segments_np(
+    starts: np.ndarray,
+    ends: np.ndarray,
+    max_duration_s: float,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Vectorized core of :meth:`VADProcessor.split_long_segments`.
+
+    Takes parallel float64 start/end arrays and returns
+    ``(chunk_starts, chunk_ends, counts)`` where *counts* holds the
+    number of chunks each input segment was split into. Pure array math,
+    no ``SpeechSegment`` objects — callers rebuild those at the boundary.
+    """
+    n = len(starts)
+    durations = ends - starts
+
+    # Chunks per segment, then one flat index expansion: seg_idx maps
+    # every output chunk to its source segment, `within` numbers the
+    # chunks inside each segment
+    counts = np.maximum(np.ceil(durations / max_duration_s).astype(np.int64), 1)
+    seg_idx = np.repeat(np.arange(n), counts)
+    within = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+
+    chunk_len = durations / counts
+    chunk_starts = starts[seg_idx] + within * chunk_len[seg_idx]
+    chunk_ends = starts[seg_idx] + (within + 1) * chunk_len[seg_idx]
+    # Pin the outer boundaries to the originals to avoid float drift
+    first = within == 0
+    last = within == counts[seg_idx] - 1
+    chunk_starts[first] = starts[seg_idx[first]]
+    chunk_ends[last] = ends[seg_idx[last]]
+
+    return chunk_starts, chunk_ends, counts
+
+
 class VADProcessor:
     """Detect speech segments in audio using Silero-VAD, then pad and merge."""
 
@@ -34,14 +67,25 @@ class VADProcessor:
             self._model = load_silero_vad()
             logger.info("Silero-VAD model loaded.")
 
-    def detect_speech(self, audio_path: str) -> list[SpeechSegment]:
-        """Run VAD on audio and return speech segments (in seconds)."""
+    def detect_speech(self, audio) -> list[SpeechSegment]:
+        """Run VAD on audio and return speech segments (in seconds).
+
+        Args:
+            audio: path to a 16 kHz mono WAV file, or the decoded float32
+                samples (16 kHz) — arrays skip the file decode entirely.
+        """
         from silero_vad import get_speech_timestamps, read_audio
 
         self._ensure_model()
 
-        logger.info(f"Running VAD on: {audio_path}")
-        wav = read_audio(audio_path)
+        if isinstance(audio, str):
+            logger.info(f"Running VAD on: {audio}")
+            wav = read_audio(audio)
+        else:
+            import torch
+
+            logger.info("Running VAD on in-memory audio...")
+            wav = torch.from_numpy(audio)
 
         timestamps = get_speech_timestamps(
             wav,
@@ -79,28 +123,36 @@ class VADProcessor:
         if not segments:
             return []
 
-        # Expand
-        expanded = []
-        for seg in segments:
-            start = max(0.0, seg.start_time - padding_s)
-            end = min(audio_duration, seg.end_time + padding_s)
-            expanded.append(SpeechSegment(start_time=start, end_time=end))
-
-        # Sort by start time
-        expanded.sort(key=lambda s: s.start_time)
-
-        # Merge overlapping
-        merged: list[SpeechSegment] = [expanded[0]]
-        for seg in expanded[1:]:
-            last = merged[-1]
-            if seg.start_time <= last.end_time:
-                # Overlapping or adjacent – extend
-                merged[-1] = SpeechSegment(
-                    start_time=last.start_time,
-                    end_time=max(last.end_time, seg.end_time),
-                )
-            else:
-                merged.append(seg)
+        # Pad + clamp + sort + merge all happen on float arrays, so the
+        # cost stays at C speed even for thousands of VAD segments
+        n = len(segments)
+        starts = np.fromiter(
+            (seg.start_time for seg in segments), dtype=np.float64, count=n
+        )
+        ends = np.fromiter(
+            (seg.end_time for seg in segments), dtype=np.float64, count=n
+        )
+        starts = np.maximum(starts - padding_s, 0.0)
+        ends = np.minimum(ends + padding_s, audio_duration)
+
+        order = np.argsort(starts, kind="stable")
+        starts = starts[order]
+        ends = ends[order]
+
+        # A segment opens a new group when it starts after the running
+        # maximum end of everything before it (overlap/adjacency merges)
+        run_max = np.maximum.accumulate(ends)
+        new_group = np.empty(n, dtype=bool)
+        new_group[0] = True
+        new_group[1:] = starts[1:] > run_max[:-1]
+        group_starts = np.flatnonzero(new_group)
+
+        merged = [
+            SpeechSegment(start_time=s, end_time=e)
+            for s, e in zip(
+                starts[group_starts], np.maximum.reduceat(ends, group_starts)
+            )
+        ]
 
         logger.info(
             f"After padding ({padding_s}s) and merging: {len(merged)} segment(s) "
@@ -122,28 +174,37 @@ class VADProcessor:
         Returns:
             List of segments, with any over-long segments split evenly.
         """
-        if max_duration_s <= 0:
+        if max_duration_s <= 0 or not segments:
             return segments
 
-        result: list[SpeechSegment] = []
-        for seg in segments:
-            duration = seg.end_time - seg.start_time
-            if duration <= max_duration_s:
-                result.append(seg)
-            else:
-                # Split into roughly equal chunks, each <= max_duration_s
-                n_chunks = math.ceil(duration / max_duration_s)
-                chunk_len = duration / n_chunks
-                for j in range(n_chunks):
-                    chunk_start = seg.start_time + j * chunk_len
-                    chunk_end = seg.start_time + (j + 1) * chunk_len
-                    if j == n_chunks - 1:
-                        chunk_end = seg.end_time  # avoid floating-point drift
-                    result.append(SpeechSegment(start_time=chunk_start, end_time=chunk_end))
-                logger.info(
-                    f"Split segment [{seg.start_time:.1f}s - {seg.end_time:.1f}s] "
-                    f"({duration:.1f}s) into {n_chunks} chunks (max {max_duration_s}s each)"
-                )
+        n = len(segments)
+        starts = np.fromiter(
+            (seg.start_time for seg in segments), dtype=np.float64, count=n
+        )
+        ends = np.fromiter(
+            (seg.end_time for seg in segments), dtype=np.float64, count=n
+        )
+        chunk_starts, chunk_ends, counts = _split_long_segments_np(
+            starts, ends, max_duration_s
+        )
+
+        result = [
+            SpeechSegment(start_time=s, end_time=e)
+            for s, e in zip(chunk_starts, chunk_ends)
+        ]
+
+        # Positional args let loguru defer formatting until a sink accepts
+        # the record — this fires once per over-long segment
+        for idx in np.flatnonzero(counts > 1):
+            logger.info(
+                "Split segment [{:.1f}s - {:.1f}s] ({:.1f}s) into {} chunks "
+                "(max {}s each)",
+                starts[idx],
+                ends[idx],
+                ends[idx] - starts[idx],
+                counts[idx],
+                max_duration_s,
+            )
         if len(result) != len(segments):
             logger.info(
                 f"After splitting long segments: {len(result)} segment(s) "
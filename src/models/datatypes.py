@@ -3,10 +3,26 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
+if TYPE_CHECKING:
+    import numpy as np
 
-@dataclass
+
+def _srt_timestamp(seconds: float) -> str:
+    """Format seconds as an SRT timestamp (HH:MM:SS,mmm).
+
+    One rounding plus a divmod chain on integers — no repeated float
+    modulo/int truncation per field.
+    """
+    ms = int(seconds * 1000 + 0.5)
+    s, ms = divmod(ms, 1000)
+    m, s = divmod(s, 60)
+    h, m = divmod(m, 60)
+    return f"{h:02d}:{m:02d}:{s:02d},{ms:03d}"
+
+
+@dataclass(slots=True, frozen=True)
 class SpeechSegment:
     """A segment of audio that contains speech, detected by VAD."""
 
@@ -18,16 +34,53 @@ class SpeechSegment:
         return self.end_time - self.start_time
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class WordTimestamp:
-    """A single word with its time boundaries from ASR."""
+    """A single word with its time boundaries from ASR.
+
+    Slots keep these small and fast to allocate — long recordings create
+    one instance per recognized word. Frozen instances can be shared
+    freely between pipeline stages; adjusted copies are built with
+    ``dataclasses.replace``.
+    """
 
     word: str
     start: float  # seconds
     end: float  # seconds
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
+class WordArray:
+    """Struct-of-arrays view over a list of :class:`WordTimestamp`.
+
+    Timing and length math over thousands of words runs on the parallel
+    NumPy arrays instead of touching three Python attributes per word;
+    ``texts`` stays a tuple so slices join back into strings directly.
+    """
+
+    texts: tuple[str, ...]
+    starts: np.ndarray  # float64, seconds
+    ends: np.ndarray  # float64, seconds
+    lengths: np.ndarray  # int64, len() of each text
+
+    @classmethod
+    def from_words(cls, words: list[WordTimestamp]) -> WordArray:
+        import numpy as np
+
+        n = len(words)
+        texts = tuple(w.word for w in words)
+        return cls(
+            texts=texts,
+            starts=np.fromiter((w.start for w in words), np.float64, count=n),
+            ends=np.fromiter((w.end for w in words), np.float64, count=n),
+            lengths=np.fromiter(map(len, texts), np.int64, count=n),
+        )
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+
+@dataclass(slots=True, frozen=True)
 class TranscriptionSegment:
     """ASR output for a speech segment: text with word-level timestamps."""
 
@@ -53,16 +106,12 @@ class SubtitleEntry:
 
     def format_timestamp_srt(self, seconds: float) -> str:
         """Format seconds as SRT timestamp: HH:MM:SS,mmm"""
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        secs = int(seconds % 60)
-        millis = int(round((seconds - int(seconds)) * 1000))
-        return f"{hours:02d}:{minutes:02d}:{secs:02d},{millis:03d}"
+        return _srt_timestamp(seconds)
 
     def to_srt_block(self) -> str:
         """Format as a single SRT subtitle block."""
-        start_ts = self.format_timestamp_srt(self.start_time)
-        end_ts = self.format_timestamp_srt(self.end_time)
+        start_ts = _srt_timestamp(self.start_time)
+        end_ts = _srt_timestamp(self.end_time)
         prefix = f"[{self.speaker}] " if self.speaker else ""
         return f"{self.index}\n{start_ts} --> {end_ts}\n{prefix}{self.text}\n"
 
@@ -74,9 +123,3 @@ class SubtitleEntry:
             self.speaker or "",
             self.text,
         ]
-
-
-class CancelledException(Exception):
-    """Raised when the user cancels the processing pipeline."""
-
-    pass
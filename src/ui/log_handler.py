@@ -2,24 +2,63 @@
 
 from __future__ import annotations
 
-from PyQt5.QtCore import QObject, pyqtSignal
+import threading
+
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
 
 
 class QtLogHandler(QObject):
-    """Loguru sink that forwards log records to a Qt signal.
+    """Loguru sink that forwards log records to a Qt signal in batches.
+
+    ``write`` may be called from any thread; records accumulate in a
+    lock-protected list and a GUI-side timer drains them into a single
+    ``log_batch`` emission, so a verbose pipeline costs one queued
+    cross-thread hop per poll interval instead of one per message.
 
     Usage::
 
         handler = QtLogHandler()
-        handler.log_received.connect(some_slot)
+        handler.log_batch.connect(some_slot)  # receives list[(level, text)]
         logger.add(handler.write, format="...", level="INFO")
+        handler.start_polling()
     """
 
-    log_received = pyqtSignal(str, str)  # (level_name, formatted_message)
+    log_batch = pyqtSignal(list)  # list of (level_name, formatted_message)
+
+    # Hard cap on buffered records: if the GUI stalls, further messages are
+    # dropped rather than growing the buffer without bound
+    _MAX_BUFFER = 1000
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self._lock = threading.Lock()
+        self._buffer: list[tuple[str, str]] = []
+        self._poll_timer: QTimer | None = None
 
     def write(self, message) -> None:  # noqa: ANN001 – loguru passes a Message object
         """Loguru sink callable. *message* is a loguru ``Message`` with a ``.record`` dict."""
         record = message.record
-        level = record["level"].name
-        text = str(message).rstrip("\n")
-        self.log_received.emit(level, text)
+        item = (record["level"].name, str(message).rstrip("\n"))
+        with self._lock:
+            if len(self._buffer) < self._MAX_BUFFER:
+                self._buffer.append(item)
+
+    def drain(self) -> list[tuple[str, str]]:
+        """Atomically take and return all buffered records."""
+        with self._lock:
+            items, self._buffer = self._buffer, []
+        return items
+
+    def start_polling(self, interval_ms: int = 30) -> None:
+        """Start the GUI-thread timer that drains the buffer into ``log_batch``."""
+        if self._poll_timer is not None:
+            return
+        self._poll_timer = QTimer(self)
+        self._poll_timer.setInterval(interval_ms)
+        self._poll_timer.timeout.connect(self._poll)
+        self._poll_timer.start()
+
+    def _poll(self) -> None:
+        items = self.drain()
+        if items:
+            self.log_batch.emit(items)
@@ -4,18 +4,39 @@ from __future__ import annotations
 
 import os
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional
 
 from loguru import logger
-from PyQt5.QtCore import Qt, pyqtSlot, QUrl, QThread, pyqtSignal
-from PyQt5.QtGui import QPixmap, QIcon, QDesktopServices
-from PyQt5.QtSvg import QSvgWidget  # Import SVG support
+from PyQt5.QtCore import (
+    Qt,
+    pyqtSlot,
+    QEventLoop,
+    QRunnable,
+    QThread,
+    QThreadPool,
+    QTimer,
+    QUrl,
+    pyqtSignal,
+)
+from PyQt5.QtGui import (
+    QColor,
+    QDesktopServices,
+    QFont,
+    QIcon,
+    QPixmap,
+    QTextCharFormat,
+    QTextCursor,
+)
 from PyQt5.QtWidgets import (
     QApplication,
     QCheckBox,
     QComboBox,
+    QDialog,
+    QDialogButtonBox,
     QDoubleSpinBox,
     QFileDialog,
+    QFormLayout,
     QGridLayout,
     QGroupBox,
     QHBoxLayout,
@@ -23,13 +44,12 @@ from PyQt5.QtWidgets import (
     QLineEdit,
     QMainWindow,
     QMessageBox,
+    QPlainTextEdit,
     QProgressBar,
     QPushButton,
-    QScrollArea,
     QSizePolicy,
     QSpinBox,
     QStatusBar,
-    QTextEdit,
     QVBoxLayout,
     QWidget,
 )
@@ -54,6 +74,95 @@ _LOG_COLORS = {
 }
 
 
+@lru_cache(maxsize=None)
+def _log_format(level: str) -> QTextCharFormat:
+    """Return the (cached) character format for a log level.
+
+    Built lazily because QTextCharFormat needs a QApplication; one format
+    object per level is then reused for every inserted line.
+    """
+    fmt = QTextCharFormat()
+    fmt.setForeground(QColor(_LOG_COLORS.get(level, "#E0E0E0")))
+    return fmt
+
+# Translation languages shown in the source/target combos, in display
+# order; the code -> display map and its inverse derive from this tuple so
+# all three stay in sync and are built once at import
+_TRANSLATION_LANGUAGES = (
+    "英语 (en)",
+    "中文 (zh)",
+    "日语 (ja)",
+    "朝鲜语 (ko)",
+    "法语 (fr)",
+    "德语 (de)",
+    "西班牙语 (es)",
+    "俄语 (ru)",
+    "阿拉伯语 (ar)",
+)
+_LANG_DISPLAY = {t[t.rfind("(") + 1:-1]: t for t in _TRANSLATION_LANGUAGES}
+
+# Endpoints with a dedicated preset in the HF endpoint dialog; anything
+# else counts as a custom endpoint
+_KNOWN_HF_ENDPOINTS = frozenset(("", "https://hf-mirror.com"))
+
+
+def _extract_lang_code(text: str, default: str) -> str:
+    """Parse a code out of display text like ``"英语 (en)"``.
+
+    Fallback for texts missing from the inverse table; rpartition avoids
+    the list a split-based parse would allocate.
+    """
+    _, sep, tail = text.rpartition("(")
+    if sep and tail.endswith(")"):
+        return tail[:-1]
+    return default
+
+
+@lru_cache(maxsize=1)
+def _github_pixmap() -> QPixmap:
+    """Rasterize and scale the GitHub logo once per process.
+
+    SVG rasterization plus smooth scaling is the expensive part; every
+    caller after the first gets the cached pixmap.
+    """
+    svg_path = os.path.join(
+        os.path.dirname(os.path.dirname(__file__)), "ui", "pic",
+        "GitHub_Lockup_White.svg",
+    )
+    return QPixmap(svg_path).scaled(
+        60, 14, Qt.KeepAspectRatio, Qt.SmoothTransformation
+    )
+
+
+class DeviceProbeWorker(QThread):
+    """Probe available compute devices off the UI thread.
+
+    ``get_available_devices`` loads libcuda and enumerates GPUs, which can
+    block for hundreds of milliseconds on cold start — too long for window
+    construction.
+    """
+
+    devices_ready = pyqtSignal(list, str)  # (device names, status-bar text)
+
+    def run(self):
+        self.devices_ready.emit(get_available_devices(), get_device_display_info())
+
+
+class _SettingsFlushTask(QRunnable):
+    """Thread-pool task that serializes and writes settings to disk."""
+
+    def __init__(self, settings: SettingsManager, done_callback) -> None:
+        super().__init__()
+        self._settings = settings
+        self._done = done_callback
+
+    def run(self) -> None:
+        try:
+            self._settings.save()
+        finally:
+            self._done()
+
+
 class HFTokenValidationThread(QThread):
     """Thread for validating HuggingFace token in the background."""
     validation_result = pyqtSignal(bool)  # True for valid, False for invalid
@@ -84,19 +193,60 @@ class MainWindow(QMainWindow):
         self.setMinimumSize(960, 720)
         self.resize(1060, 800)
 
+        # Apply the stylesheet before any child widget exists: each widget
+        # then gets polished once at creation instead of being created with
+        # the default style and re-polished when the sheet lands later
+        self.setStyleSheet(get_dark_stylesheet())
+
         self._settings = SettingsManager()
         self._worker: Optional[PipelineWorker] = None
 
-        # Log handler (bridges loguru -> UI)
+        # Debounce timer for auto-save: widget signal storms (e.g. spinbox
+        # scrubbing) coalesce into one disk write per burst
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(250)
+        self._save_timer.timeout.connect(self._do_save)
+        # True while a background settings write is running on the pool
+        self._flush_in_flight = False
+
+        # (signal, slot) pairs recorded by _connect for bulk disconnect
+        self._connections: list[tuple] = []
+
+        # Last progress values shown; _on_progress drops ticks that would
+        # repaint the same state (reset per run in _start_processing)
+        self._last_pct = -1
+        self._last_detail = ""
+        self._last_status = ""
+
+        # Log handler (bridges loguru -> UI): records batch up handler-side
+        # and arrive here as one signal per poll interval
         self._log_handler = QtLogHandler()
-        self._log_handler.log_received.connect(self._on_log_message)
+        self._log_handler.log_batch.connect(self._on_log_batch)
         self._log_sink_id = add_ui_sink(self._log_handler.write, log_level="DEBUG")
-
-        self._build_ui()
-        self._load_settings()
-        self._connect_signals()
-
-        self.setStyleSheet(get_dark_stylesheet())
+        self._log_handler.start_polling()
+
+        # Log lines buffer: appends are cheap, and a short coalescing timer
+        # flushes them into the viewer in one document edit per burst. The
+        # buffer also holds lines arriving before the log section exists.
+        self._log_buffer: list[tuple[str, str]] = []
+        self._log_flush_timer = QTimer(self)
+        self._log_flush_timer.setSingleShot(True)
+        self._log_flush_timer.setInterval(50)
+        self._log_flush_timer.timeout.connect(self._flush_log)
+        self._ui_ready = False
+
+        # Only the sections visible at first paint are built synchronously;
+        # the rest (params/output/progress/log) are deferred to the next
+        # event-loop turn so the window shows up sooner
+        self._build_ui_critical()
+        QTimer.singleShot(0, self._build_ui_deferred)
+
+        # Probe compute devices in the background; the combo and status bar
+        # show placeholders until the result arrives
+        self._device_probe = DeviceProbeWorker(self)
+        self._device_probe.devices_ready.connect(self._on_devices_ready)
+        self._device_probe.start()
 
         logger.info("应用程序已启动")
 
@@ -104,7 +254,7 @@ class MainWindow(QMainWindow):
     # UI Construction
     # ==================================================================
 
-    def _build_ui(self) -> None:
+    def _build_ui_critical(self) -> None:
         central = QWidget()
         self.setCentralWidget(central)
 
@@ -120,37 +270,68 @@ class MainWindow(QMainWindow):
         hf_token_action = options_menu.addAction('HuggingFace Token')
         hf_token_action.triggered.connect(self._show_hf_token_dialog)
         
-        # Scroll area for the whole content
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setFrameShape(QScrollArea.NoFrame)
-
-        content = QWidget()
-        self._main_layout = QVBoxLayout(content)
+        # Content layout goes straight on the central widget: the window
+        # enforces a minimum size and the sections are static, so the old
+        # QScrollArea wrapper only added viewport/scrollbar bookkeeping to
+        # every resize. The log viewer scrolls on its own.
+        self._main_layout = QVBoxLayout(central)
         self._main_layout.setSpacing(8)
         self._main_layout.setContentsMargins(12, 8, 12, 8)
 
         self._build_input_section()
         self._build_model_section()
-        self._build_params_section()
-        self._build_output_section()
-        self._build_progress_section()
-        self._build_log_section()
-
-        scroll.setWidget(content)
-
-        outer = QVBoxLayout(central)
-        outer.setContentsMargins(0, 0, 0, 0)
-        outer.addWidget(scroll)
 
         # Status bar
         self._status_bar = QStatusBar()
         self.setStatusBar(self._status_bar)
-        self._device_label = QLabel(get_device_display_info())
+        self._device_label = QLabel("检测中...")
         self._version_label = QLabel("v1.0.0")
         self._status_bar.addPermanentWidget(self._version_label)
         self._status_bar.addPermanentWidget(self._device_label)
 
+    def _build_ui_deferred(self) -> None:
+        """Build the below-the-fold sections after the first paint.
+
+        Runs on the event loop right after the window shows; settings
+        loading and signal wiring follow here because they touch widgets
+        from both halves.
+        """
+        self._build_params_section()
+        self._build_output_section()
+        self._build_progress_section()
+        self._build_log_section()
+
+        # Controls that follow the run/idle state as one group; _stop_btn
+        # has inverted polarity and the lazily-built translation rows are
+        # handled separately in _set_ui_enabled
+        self._toggleable_widgets = (
+            self._start_btn,
+            self._browse_input_btn,
+            self._browse_csv_btn,
+            self._browse_srt_btn,
+            self._asr_type_combo,
+            self._model_size_combo,
+            self._device_combo,
+            self._enable_diarization,
+            self._enable_translation,
+            self._language_combo,
+            self._vad_threshold,
+            self._silence_delay,
+            self._padding_spin,
+            self._max_chars,
+            self._max_speech_duration,
+            self._model_dir_input,
+            self._browse_model_dir_btn,
+            self._reset_btn,
+        )
+
+        self._load_settings()
+        self._connect_signals()
+        self._ui_ready = True
+
+        # Flush log lines that arrived before the viewer existed
+        self._flush_log()
+
     # -- Input file section ------------------------------------------------
 
     def _build_input_section(self) -> None:
@@ -171,27 +352,27 @@ class MainWindow(QMainWindow):
         row = QHBoxLayout()
         row.setSpacing(8)
 
-        # ASR model config
+        # ASR model config. QFormLayout manages the label column itself:
+        # fewer layout items than the grid + hand-placed QLabels
         asr_group = QGroupBox("ASR 模型配置")
-        asr_layout = QGridLayout()
+        asr_form = QFormLayout()
 
-        asr_layout.addWidget(QLabel("模型类型:"), 0, 0)
         self._asr_type_combo = QComboBox()
         for t in ASRRegistry.list_types():
             self._asr_type_combo.addItem(ASRRegistry.get_display_name(t), t)
-        asr_layout.addWidget(self._asr_type_combo, 0, 1)
+        asr_form.addRow("模型类型:", self._asr_type_combo)
 
-        asr_layout.addWidget(QLabel("模型规格:"), 1, 0)
         self._model_size_combo = QComboBox()
-        asr_layout.addWidget(self._model_size_combo, 1, 1)
+        asr_form.addRow("模型规格:", self._model_size_combo)
 
-        asr_layout.addWidget(QLabel("计算设备:"), 2, 0)
         self._device_combo = QComboBox()
-        for dev in get_available_devices():
-            self._device_combo.addItem(dev)
-        asr_layout.addWidget(self._device_combo, 2, 1)
+        # Real devices arrive from DeviceProbeWorker; show a placeholder
+        # instead of blocking construction on CUDA enumeration
+        self._device_combo.addItem("检测中...")
+        self._device_idx = self._index_map(self._device_combo)
+        asr_form.addRow("计算设备:", self._device_combo)
 
-        asr_group.setLayout(asr_layout)
+        asr_group.setLayout(asr_form)
         row.addWidget(asr_group, 1)
 
         # Speaker diarization
@@ -210,55 +391,12 @@ class MainWindow(QMainWindow):
         )
         diar_layout.addWidget(self._enable_translation)
         
-        # Translation options container (will be shown/hidden based on checkbox)
-        self._translation_options_widget = QWidget()
-        translation_options_layout = QVBoxLayout()
-        translation_options_layout.setContentsMargins(0, 0, 0, 0)
-        translation_options_layout.setSpacing(4)
-        
-        # Model size row
-        model_size_row = QHBoxLayout()
-        model_size_row.addWidget(QLabel("模型尺寸:"))
-        self._translation_model_size = QComboBox()
-        self._translation_model_size.addItems(["4b", "12b"])
-        self._translation_model_size.setCurrentText("4b")
-        self._translation_model_size.setToolTip("选择翻译模型规模")
-        model_size_row.addWidget(self._translation_model_size)
-        model_size_row.addStretch()
-        translation_options_layout.addLayout(model_size_row)
-        
-        # Source language row
-        source_lang_row = QHBoxLayout()
-        source_lang_row.addWidget(QLabel("原文语言:"))
-        self._translation_source_lang = QComboBox()
-        self._translation_source_lang.addItems([
-            "英语 (en)", "中文 (zh)", "日语 (ja)", "朝鲜语 (ko)", "法语 (fr)",
-            "德语 (de)", "西班牙语 (es)", "俄语 (ru)", "阿拉伯语 (ar)"
-        ])
-        self._translation_source_lang.setCurrentText("中文 (zh)")
-        self._translation_source_lang.setToolTip("选择翻译源语言")
-        source_lang_row.addWidget(self._translation_source_lang)
-        source_lang_row.addStretch()
-        translation_options_layout.addLayout(source_lang_row)
-        
-        # Target language row
-        target_lang_row = QHBoxLayout()
-        target_lang_row.addWidget(QLabel("译文语言:"))
-        self._translation_target_lang = QComboBox()
-        self._translation_target_lang.addItems([
-            "英语 (en)", "中文 (zh)", "日语 (ja)", "朝鲜语 (ko)", "法语 (fr)",
-            "德语 (de)", "西班牙语 (es)", "俄语 (ru)", "阿拉伯语 (ar)"
-        ])
-        self._translation_target_lang.setCurrentText("英语 (en)")
-        self._translation_target_lang.setToolTip("选择翻译目标语言")
-        target_lang_row.addWidget(self._translation_target_lang)
-        target_lang_row.addStretch()
-        translation_options_layout.addLayout(target_lang_row)
-        
-        self._translation_options_widget.setLayout(translation_options_layout)
-        self._translation_options_widget.setVisible(False)  # Initially hidden
-        diar_layout.addWidget(self._translation_options_widget)
-        
+        # Translation options are built lazily on first enable — users who
+        # never turn translation on skip three rows of widgets and their
+        # combo populations at every startup
+        self._translation_options_widget = None
+        self._diar_layout = diar_layout
+
         diar_layout.addStretch()
         diar_group.setLayout(diar_layout)
         row.addWidget(diar_group, 1)
@@ -274,49 +412,46 @@ class MainWindow(QMainWindow):
 
     def _build_params_section(self) -> None:
         group = QGroupBox("处理参数")
-        grid = QGridLayout()
-        grid.setHorizontalSpacing(12)
+        layout = QVBoxLayout()
+
+        # Two side-by-side label/field columns: QFormLayout's pairwise row
+        # engine replaces the hand-placed grid labels
+        forms_row = QHBoxLayout()
+        forms_row.setSpacing(12)
+        left_form = QFormLayout()
+        right_form = QFormLayout()
 
-        # Row 0
-        grid.addWidget(QLabel("目标语言:"), 0, 0)
         self._language_combo = QComboBox()
         for code, display in LANGUAGES.items():
             self._language_combo.addItem(display, code)
-        grid.addWidget(self._language_combo, 0, 1)
+        left_form.addRow("目标语言:", self._language_combo)
 
-        grid.addWidget(QLabel("VAD 阈值:"), 0, 2)
         self._vad_threshold = QDoubleSpinBox()
         self._vad_threshold.setRange(0.01, 1.0)
         self._vad_threshold.setSingleStep(0.05)
         self._vad_threshold.setDecimals(2)
         self._vad_threshold.setToolTip("语音活动检测的置信度阈值，越高越严格")
-        grid.addWidget(self._vad_threshold, 0, 3)
+        right_form.addRow("VAD 阈值:", self._vad_threshold)
 
-        # Row 1
-        grid.addWidget(QLabel("静音结束延迟 (ms):"), 1, 0)
         self._silence_delay = QSpinBox()
         self._silence_delay.setRange(50, 5000)
         self._silence_delay.setSingleStep(50)
         self._silence_delay.setToolTip("检测到静音后等待多少毫秒才判定语音结束")
-        grid.addWidget(self._silence_delay, 1, 1)
+        left_form.addRow("静音结束延迟 (ms):", self._silence_delay)
 
-        grid.addWidget(QLabel("片段前后扩充 (秒):"), 1, 2)
         self._padding_spin = QDoubleSpinBox()
         self._padding_spin.setRange(0.0, 10.0)
         self._padding_spin.setSingleStep(0.5)
         self._padding_spin.setDecimals(1)
         self._padding_spin.setToolTip("对 VAD 检测到的每个语音片段前后各扩展的时长")
-        grid.addWidget(self._padding_spin, 1, 3)
+        right_form.addRow("片段前后扩充 (秒):", self._padding_spin)
 
-        # Row 2
-        grid.addWidget(QLabel("单条字幕上限 (字):"), 2, 0)
         self._max_chars = QSpinBox()
         self._max_chars.setRange(10, 200)
         self._max_chars.setSingleStep(5)
         self._max_chars.setToolTip("单条字幕的最大字符数，超出会自动拆分")
-        grid.addWidget(self._max_chars, 2, 1)
+        left_form.addRow("单条字幕上限 (字):", self._max_chars)
 
-        grid.addWidget(QLabel("语音片段上限 (秒):"), 2, 2)
         self._max_speech_duration = QDoubleSpinBox()
         self._max_speech_duration.setRange(5.0, 300.0)
         self._max_speech_duration.setSingleStep(5.0)
@@ -324,26 +459,41 @@ class MainWindow(QMainWindow):
         self._max_speech_duration.setToolTip(
             "单个语音片段的最大时长，超长片段将被强制切分后再送入 ASR"
         )
-        grid.addWidget(self._max_speech_duration, 2, 3)
-
-        # Row 3
-        grid.addWidget(QLabel("模型存储路径:"), 3, 0)
+        right_form.addRow("语音片段上限 (秒):", self._max_speech_duration)
+
+        # Emit valueChanged once per committed edit instead of per
+        # keystroke; the auto-save debounce then sees one burst per edit
+        for spin in (
+            self._vad_threshold,
+            self._silence_delay,
+            self._padding_spin,
+            self._max_chars,
+            self._max_speech_duration,
+        ):
+            spin.setKeyboardTracking(False)
+
+        forms_row.addLayout(left_form, 1)
+        forms_row.addLayout(right_form, 1)
+        layout.addLayout(forms_row)
+
+        # Model storage path
         model_path_layout = QHBoxLayout()
+        model_path_layout.addWidget(QLabel("模型存储路径:"))
         self._model_dir_input = QLineEdit()
         self._model_dir_input.setPlaceholderText("留空使用默认缓存路径")
         self._browse_model_dir_btn = QPushButton("更改...")
         model_path_layout.addWidget(self._model_dir_input, 1)
         model_path_layout.addWidget(self._browse_model_dir_btn)
-        grid.addLayout(model_path_layout, 3, 1, 1, 3)
+        layout.addLayout(model_path_layout)
 
-        # Row 4: reset button
+        # Reset button
         btn_row = QHBoxLayout()
         self._reset_btn = QPushButton("重置为默认值")
         btn_row.addStretch()
         btn_row.addWidget(self._reset_btn)
-        grid.addLayout(btn_row, 4, 0, 1, 4)
+        layout.addLayout(btn_row)
 
-        group.setLayout(grid)
+        group.setLayout(layout)
         self._main_layout.addWidget(group)
 
     # -- Output section ----------------------------------------------------
@@ -409,9 +559,20 @@ class MainWindow(QMainWindow):
         group = QGroupBox("日志输出")
         layout = QVBoxLayout()
 
-        self._log_viewer = QTextEdit()
+        # QPlainTextEdit's block-based layout appends log lines several
+        # times faster than QTextEdit's rich-text engine, and per-level
+        # colors come from cursor char formats instead of HTML parsing
+        self._log_viewer = QPlainTextEdit()
         self._log_viewer.setObjectName("log_viewer")
         self._log_viewer.setReadOnly(True)
+        # FIFO-trim old blocks, use fixed glyph metrics and skip word-wrap
+        # math: long runs append 10k+ lines and layout cost would otherwise
+        # dominate
+        self._log_viewer.setMaximumBlockCount(5000)
+        font = QFont("Consolas", 9)
+        font.setStyleHint(QFont.Monospace)
+        self._log_viewer.setFont(font)
+        self._log_viewer.setLineWrapMode(QPlainTextEdit.NoWrap)
         self._log_viewer.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         self._log_viewer.setMinimumHeight(120)
         layout.addWidget(self._log_viewer, 1)
@@ -431,16 +592,9 @@ class MainWindow(QMainWindow):
         github_row = QHBoxLayout()
         github_row.addStretch()  # Left padding
         
-        # Create a clickable SVG widget for GitHub logo
-        github_svg_widget = QSvgWidget()
-        github_svg_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'ui', 'pic', 'GitHub_Lockup_White.svg')
-        github_svg_widget.load(github_svg_path)
-        github_svg_widget.setFixedSize(60, 14)  # Adjust size to fit the GitHub logo appropriately
-        github_svg_widget.setStyleSheet("background: transparent;")  # Make background transparent
-        
         # Create a clickable label that will handle the click event
         github_clickable_label = QLabel()
-        github_clickable_label.setPixmap(github_svg_widget.grab())  # Grab the rendered SVG as pixmap
+        github_clickable_label.setPixmap(_github_pixmap())
         github_clickable_label.setCursor(Qt.PointingHandCursor)  # Set cursor to hand pointer
         github_clickable_label.mousePressEvent = lambda event: self._open_github_link()
         
@@ -459,8 +613,6 @@ class MainWindow(QMainWindow):
     
     def _open_github_link(self):
         """Open the GitHub repository link in the default browser."""
-        from PyQt5.QtCore import QUrl
-        from PyQt5.QtGui import QDesktopServices
         QDesktopServices.openUrl(QUrl("https://github.com/zong307/SubtitleExtractor"))
 
     # ==================================================================
@@ -490,7 +642,6 @@ class MainWindow(QMainWindow):
         """Handle the result from the background token validation."""
         if not is_valid:
             # Token is invalid, show warning and uncheck the checkbox
-            from PyQt5.QtWidgets import QMessageBox
             QMessageBox.warning(
                 self,
                 "验证失败",
@@ -517,42 +668,66 @@ class MainWindow(QMainWindow):
             logger.error(f"HuggingFace token validation failed: {e}")
             return False
 
+    def _connect(self, signal, slot) -> None:
+        """Connect and record, so closeEvent can disconnect in bulk."""
+        signal.connect(slot)
+        self._connections.append((signal, slot))
+
     def _connect_signals(self) -> None:
+        connect = self._connect
+
         # Buttons
-        self._browse_input_btn.clicked.connect(self._browse_input_file)
-        self._browse_csv_btn.clicked.connect(lambda: self._browse_save_file("csv"))
-        self._browse_srt_btn.clicked.connect(lambda: self._browse_save_file("srt"))
-        self._browse_model_dir_btn.clicked.connect(self._browse_model_dir)
-        self._start_btn.clicked.connect(self._start_processing)
-        self._stop_btn.clicked.connect(self._stop_processing)
-        self._clear_log_btn.clicked.connect(self._log_viewer.clear)
-        self._export_log_btn.clicked.connect(self._export_log)
-        self._reset_btn.clicked.connect(self._reset_settings)
+        connect(self._browse_input_btn.clicked, self._browse_input_file)
+        connect(self._browse_csv_btn.clicked, lambda: self._browse_save_file("csv"))
+        connect(self._browse_srt_btn.clicked, lambda: self._browse_save_file("srt"))
+        connect(self._browse_model_dir_btn.clicked, self._browse_model_dir)
+        connect(self._start_btn.clicked, self._start_processing)
+        connect(self._stop_btn.clicked, self._stop_processing)
+        connect(self._clear_log_btn.clicked, self._log_viewer.clear)
+        connect(self._export_log_btn.clicked, self._export_log)
+        connect(self._reset_btn.clicked, self._reset_settings)
 
         # ASR type change -> update model size options
-        self._asr_type_combo.currentIndexChanged.connect(self._update_model_sizes)
-
-        # Auto-save on any change
-        self._asr_type_combo.currentIndexChanged.connect(self._auto_save)
-        self._model_size_combo.currentIndexChanged.connect(self._auto_save)
-        self._device_combo.currentIndexChanged.connect(self._auto_save)
-        self._enable_diarization.stateChanged.connect(self._auto_save)
-        self._enable_translation.stateChanged.connect(self._auto_save)
-        self._translation_target_lang.currentTextChanged.connect(self._auto_save)
-        self._translation_model_size.currentTextChanged.connect(self._auto_save)
-        self._translation_source_lang.currentTextChanged.connect(self._auto_save)
-        self._language_combo.currentIndexChanged.connect(self._auto_save)
+        connect(self._asr_type_combo.currentIndexChanged, self._update_model_sizes)
+
+        # Auto-save on any change: one table, one loop. Translation combos
+        # connect in _build_translation_options when (and if) they are
+        # built.
+        autosave_signals = (
+            self._asr_type_combo.currentIndexChanged,
+            self._model_size_combo.currentIndexChanged,
+            self._device_combo.currentIndexChanged,
+            self._enable_diarization.stateChanged,
+            self._enable_translation.stateChanged,
+            self._language_combo.currentIndexChanged,
+            self._vad_threshold.valueChanged,
+            self._silence_delay.valueChanged,
+            self._padding_spin.valueChanged,
+            self._max_chars.valueChanged,
+            self._max_speech_duration.valueChanged,
+            self._model_dir_input.editingFinished,
+        )
+        for signal in autosave_signals:
+            connect(signal, self._auto_save)
+
         # Connect ASR target language change to sync with translation source language
-        self._language_combo.currentIndexChanged.connect(self._sync_asr_language_to_translation)
-        self._vad_threshold.valueChanged.connect(self._auto_save)
-        self._silence_delay.valueChanged.connect(self._auto_save)
-        self._padding_spin.valueChanged.connect(self._auto_save)
-        self._max_chars.valueChanged.connect(self._auto_save)
-        self._max_speech_duration.valueChanged.connect(self._auto_save)
-        self._model_dir_input.editingFinished.connect(self._auto_save)
-        
+        connect(self._language_combo.currentIndexChanged, self._sync_asr_language_to_translation)
+
         # Enable/disable translation UI elements based on checkbox
-        self._enable_translation.stateChanged.connect(self._check_translation_token_before_toggle)
+        connect(self._enable_translation.stateChanged, self._check_translation_token_before_toggle)
+
+    def _disconnect_signals(self) -> None:
+        """Tear down recorded connections in one pass at shutdown.
+
+        Explicit disconnects are cheaper than letting Qt scan for dangling
+        receivers while the widget tree is destroyed.
+        """
+        for signal, slot in getattr(self, "_connections", ()):
+            try:
+                signal.disconnect(slot)
+            except TypeError:
+                pass  # already gone
+        self._connections = []
 
     # ==================================================================
     # Slots
@@ -592,6 +767,26 @@ class MainWindow(QMainWindow):
             self._model_dir_input.setText(path)
             self._auto_save()
 
+    @staticmethod
+    def _index_map(combo: QComboBox) -> dict[str, int]:
+        """Text -> index map for a combo box: O(1) lookups in place of the
+        linear scan ``findText`` does on every settings load/sync."""
+        return {combo.itemText(i): i for i in range(combo.count())}
+
+    @pyqtSlot(list, str)
+    def _on_devices_ready(self, devices: list, display_info: str) -> None:
+        """Fill in the probed device list and restore the saved selection."""
+        self._device_combo.blockSignals(True)
+        self._device_combo.clear()
+        self._device_combo.addItems(devices)
+        self._device_idx = self._index_map(self._device_combo)
+        saved = self._settings.get("asr.device", "cpu")
+        idx = self._device_idx.get(saved, -1)
+        if idx >= 0:
+            self._device_combo.setCurrentIndex(idx)
+        self._device_combo.blockSignals(False)
+        self._device_label.setText(display_info)
+
     def _update_model_sizes(self) -> None:
         asr_type = self._asr_type_combo.currentData()
         if not asr_type:
@@ -601,6 +796,7 @@ class MainWindow(QMainWindow):
         for size in ASRRegistry.get_model_sizes(asr_type):
             self._model_size_combo.addItem(size)
         self._model_size_combo.blockSignals(False)
+        self._model_size_idx = self._index_map(self._model_size_combo)
 
     def _start_processing(self) -> None:
         # Validate
@@ -626,6 +822,10 @@ class MainWindow(QMainWindow):
         self._progress_bar.setValue(0)
         self._status_label.setText("正在初始化...")
         self._detail_label.setText("")
+        # Reset the progress de-duplication caches for the new run
+        self._last_pct = -1
+        self._last_detail = ""
+        self._last_status = ""
 
         # Create and start worker
         self._worker = PipelineWorker(config, input_path, csv_path, srt_path)
@@ -650,13 +850,25 @@ class MainWindow(QMainWindow):
 
     @pyqtSlot(str, float, str)
     def _on_progress(self, step: str, pct: float, msg: str) -> None:
-        self._progress_bar.setValue(int(pct))
-        self._detail_label.setText(msg)
-        if step == "done":
-            self._status_label.setText("完成")
-            self._status_label.setStyleSheet("font-weight: bold; color: #10B981;")
-        else:
-            self._status_label.setText("处理中...")
+        # The worker can emit many ticks per second with the same integer
+        # percentage or detail string; every setValue/setText costs a
+        # signal emission and a repaint, so skip the ones that change
+        # nothing
+        new_pct = int(pct)
+        if new_pct != self._last_pct:
+            self._last_pct = new_pct
+            self._progress_bar.setValue(new_pct)
+        if msg != self._last_detail:
+            self._last_detail = msg
+            self._detail_label.setText(msg)
+        status = "完成" if step == "done" else "处理中..."
+        if status != self._last_status:
+            self._last_status = status
+            self._status_label.setText(status)
+            if step == "done":
+                self._status_label.setStyleSheet(
+                    "font-weight: bold; color: #10B981;"
+                )
 
     @pyqtSlot(str)
     def _on_finished_ok(self, msg: str) -> None:
@@ -679,17 +891,32 @@ class MainWindow(QMainWindow):
         self._status_label.setStyleSheet("font-weight: bold; color: #F59E0B;")
         QMessageBox.information(self, "已取消", msg)
 
-    @pyqtSlot(str, str)
-    def _on_log_message(self, level: str, text: str) -> None:
-        color = _LOG_COLORS.get(level, "#E0E0E0")
-        escaped = (
-            text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
-        )
-        html = f'<span style="color:{color};">{escaped}</span>'
-        self._log_viewer.append(html)
-        # Auto-scroll to bottom
-        sb = self._log_viewer.verticalScrollBar()
-        sb.setValue(sb.maximum())
+    @pyqtSlot(list)
+    def _on_log_batch(self, items: list) -> None:
+        # Raw (level, text) tuples go straight into the buffer; coloring
+        # happens at flush time via cached char formats, no HTML involved
+        self._log_buffer.extend(items)
+        if self._ui_ready and not self._log_flush_timer.isActive():
+            self._log_flush_timer.start()
+
+    def _flush_log(self) -> None:
+        """Insert all buffered log lines in one document edit.
+
+        The edit block groups the whole burst into a single relayout
+        instead of one append + scrollbar recompute per line.
+        """
+        if not self._ui_ready or not self._log_buffer:
+            return
+        cursor = self._log_viewer.textCursor()
+        cursor.movePosition(QTextCursor.End)
+        cursor.beginEditBlock()
+        for level, text in self._log_buffer:
+            cursor.setCharFormat(_log_format(level))
+            cursor.insertText(text + "\n")
+        cursor.endEditBlock()
+        self._log_buffer.clear()
+        self._log_viewer.moveCursor(QTextCursor.End)
+        self._log_viewer.ensureCursorVisible()
 
     def _export_log(self) -> None:
         path, _ = QFileDialog.getSaveFileName(
@@ -700,33 +927,105 @@ class MainWindow(QMainWindow):
                 f.write(self._log_viewer.toPlainText())
             logger.info(f"日志已导出至: {path}")
 
+    def _build_translation_options(self) -> None:
+        """Construct the translation option rows on first enable."""
+        widget = QWidget()
+        translation_options_layout = QVBoxLayout()
+        translation_options_layout.setContentsMargins(0, 0, 0, 0)
+        translation_options_layout.setSpacing(4)
+
+        # Model size row
+        model_size_row = QHBoxLayout()
+        model_size_row.addWidget(QLabel("模型尺寸:"))
+        self._translation_model_size = QComboBox()
+        self._translation_model_size.addItems(["4b", "12b"])
+        self._translation_model_size.setCurrentText("4b")
+        self._translation_model_size.setToolTip("选择翻译模型规模")
+        self._trans_size_idx = self._index_map(self._translation_model_size)
+        model_size_row.addWidget(self._translation_model_size)
+        model_size_row.addStretch()
+        translation_options_layout.addLayout(model_size_row)
+
+        # Source language row
+        source_lang_row = QHBoxLayout()
+        source_lang_row.addWidget(QLabel("原文语言:"))
+        self._translation_source_lang = QComboBox()
+        # Code rides along as userData so save paths read currentData()
+        # instead of parsing the display text
+        for code, display in _LANG_DISPLAY.items():
+            self._translation_source_lang.addItem(display, code)
+        self._translation_source_lang.setCurrentText("中文 (zh)")
+        self._translation_source_lang.setToolTip("选择翻译源语言")
+        self._src_lang_idx = self._index_map(self._translation_source_lang)
+        source_lang_row.addWidget(self._translation_source_lang)
+        source_lang_row.addStretch()
+        translation_options_layout.addLayout(source_lang_row)
+
+        # Target language row
+        target_lang_row = QHBoxLayout()
+        target_lang_row.addWidget(QLabel("译文语言:"))
+        self._translation_target_lang = QComboBox()
+        for code, display in _LANG_DISPLAY.items():
+            self._translation_target_lang.addItem(display, code)
+        self._translation_target_lang.setCurrentText("英语 (en)")
+        self._translation_target_lang.setToolTip("选择翻译目标语言")
+        self._tgt_lang_idx = self._index_map(self._translation_target_lang)
+        target_lang_row.addWidget(self._translation_target_lang)
+        target_lang_row.addStretch()
+        translation_options_layout.addLayout(target_lang_row)
+
+        widget.setLayout(translation_options_layout)
+        self._translation_options_widget = widget
+        # Insert below the two checkboxes, above the stretch
+        self._diar_layout.insertWidget(2, widget)
+
+        # Saved values are applied before the auto-save signals connect,
+        # so the restore does not trigger a write
+        self._apply_translation_settings()
+        connect = self._connect
+        connect(self._translation_target_lang.currentTextChanged, self._auto_save)
+        connect(self._translation_model_size.currentTextChanged, self._auto_save)
+        connect(self._translation_source_lang.currentTextChanged, self._auto_save)
+
+    def _apply_translation_settings(self) -> None:
+        """Restore the translation combos from saved settings."""
+        s = self._settings
+
+        target_lang = s.get("translation.target_language", "en")
+        target_lang_display = _LANG_DISPLAY.get(target_lang, "英语 (en)")
+        target_idx = self._tgt_lang_idx.get(target_lang_display, -1)
+        if target_idx >= 0:
+            self._translation_target_lang.setCurrentIndex(target_idx)
+
+        source_lang = s.get("translation.source_language", "zh")
+        source_lang_display = _LANG_DISPLAY.get(source_lang, "中文 (zh)")
+        source_idx = self._src_lang_idx.get(source_lang_display, -1)
+        if source_idx >= 0:
+            self._translation_source_lang.setCurrentIndex(source_idx)
+
+        model_size = s.get("translation.model_size", "4b")
+        size_idx = self._trans_size_idx.get(model_size, -1)
+        if size_idx >= 0:
+            self._translation_model_size.setCurrentIndex(size_idx)
+
     def _toggle_translation_options(self, state):
         """Show or hide translation options based on checkbox state."""
         enabled = bool(state)
-        self._translation_options_widget.setVisible(enabled)
+        if enabled and self._translation_options_widget is None:
+            self._build_translation_options()
+        if self._translation_options_widget is not None:
+            self._translation_options_widget.setVisible(enabled)
 
     def _sync_asr_language_to_translation(self):
         """Sync the ASR target language to translation source language when changed."""
         # Get the current ASR target language
         asr_lang_code = self._language_combo.currentData()
-        
-        # Convert the language code to display text
-        lang_display_map = {
-            "en": "英语 (en)",
-            "zh": "中文 (zh)",
-            "ja": "日语 (ja)",
-            "ko": "朝鲜语 (ko)",
-            "fr": "法语 (fr)",
-            "de": "德语 (de)",
-            "es": "西班牙语 (es)",
-            "ru": "俄语 (ru)",
-            "ar": "阿拉伯语 (ar)"
-        }
-        
-        asr_lang_display = lang_display_map.get(asr_lang_code, "中文 (zh)")
+        asr_lang_display = _LANG_DISPLAY.get(asr_lang_code, "中文 (zh)")
         
         # Find and set the corresponding index in the translation source language combo
-        source_idx = self._translation_source_lang.findText(asr_lang_display)
+        if self._translation_options_widget is None:
+            return  # translation never enabled; nothing to sync
+        source_idx = self._src_lang_idx.get(asr_lang_display, -1)
         if source_idx >= 0:
             self._translation_source_lang.setCurrentIndex(source_idx)
 
@@ -748,7 +1047,19 @@ class MainWindow(QMainWindow):
     # ==================================================================
 
     def _load_settings(self) -> None:
-        """Populate UI widgets from saved settings."""
+        """Populate UI widgets from saved settings.
+
+        Widget setters fire their change signals, each of which is wired to
+        _auto_save — without the guard a single load triggers a full
+        settings write per widget.
+        """
+        self._loading = True
+        try:
+            self._load_settings_inner()
+        finally:
+            self._loading = False
+
+    def _load_settings_inner(self) -> None:
         s = self._settings
 
         # ASR
@@ -758,12 +1069,12 @@ class MainWindow(QMainWindow):
             self._asr_type_combo.setCurrentIndex(idx)
         self._update_model_sizes()
         model_size = s.get("asr.model_size", "turbo")
-        idx = self._model_size_combo.findText(model_size)
+        idx = self._model_size_idx.get(model_size, -1)
         if idx >= 0:
             self._model_size_combo.setCurrentIndex(idx)
 
         device = s.get("asr.device", "cpu")
-        idx = self._device_combo.findText(device)
+        idx = self._device_idx.get(device, -1)
         if idx >= 0:
             self._device_combo.setCurrentIndex(idx)
 
@@ -787,41 +1098,15 @@ class MainWindow(QMainWindow):
         # Diarization
         self._enable_diarization.setChecked(s.get("diarization.enabled", False))
         
-        # Translation
+        # Translation: the option rows exist only after the first enable;
+        # the lazy build restores its own state, so only already-built
+        # combos need refreshing here
         self._enable_translation.setChecked(s.get("translation.enabled", False))
-        
-        # Set translation target language
-        target_lang = s.get("translation.target_language", "en")
-        lang_display_map = {
-            "en": "英语 (en)",
-            "zh": "中文 (zh)",
-            "ja": "日语 (ja)",
-            "ko": "朝鲜语 (ko)",
-            "fr": "法语 (fr)",
-            "de": "德语 (de)",
-            "es": "西班牙语 (es)",
-            "ru": "俄语 (ru)",
-            "ar": "阿拉伯语 (ar)"
-        }
-        target_lang_display = lang_display_map.get(target_lang, "英语 (en)")
-        target_idx = self._translation_target_lang.findText(target_lang_display)
-        if target_idx >= 0:
-            self._translation_target_lang.setCurrentIndex(target_idx)
-        
-        # Set translation source language
-        source_lang = s.get("translation.source_language", "zh")
-        source_lang_display = lang_display_map.get(source_lang, "中文 (zh)")
-        source_idx = self._translation_source_lang.findText(source_lang_display)
-        if source_idx >= 0:
-            self._translation_source_lang.setCurrentIndex(source_idx)
-        
-        # Set translation model size
-        model_size = s.get("translation.model_size", "4b")
-        size_idx = self._translation_model_size.findText(model_size)
-        if size_idx >= 0:
-            self._translation_model_size.setCurrentIndex(size_idx)
-        
-        # Update UI state based on translation setting
+        if self._translation_options_widget is not None:
+            self._apply_translation_settings()
+
+        # Update UI state based on translation setting (builds the rows if
+        # translation is saved as enabled)
         self._toggle_translation_options(self._enable_translation.isChecked())
         
         # Paths
@@ -830,60 +1115,116 @@ class MainWindow(QMainWindow):
         # HuggingFace endpoint - currently no UI element to load this setting to since it's in a dialog
 
     def _auto_save(self) -> None:
-        """Persist current UI state to settings file."""
+        """Schedule a debounced save; bursts collapse into one write."""
+        if getattr(self, "_loading", False):
+            return  # populating widgets from disk; nothing new to save
+        self._save_timer.start()
+
+    def _do_save(self, flush_async: bool = True) -> None:
+        """Persist current UI state to settings file.
+
+        All keys are updated in memory first, then the single serialize +
+        write runs on the global thread pool so the interactive thread
+        never waits on the disk. ``flush_async=False`` (used at shutdown)
+        writes synchronously instead.
+        """
+        if not self._ui_ready:
+            return  # deferred widgets not built yet; nothing to save
         s = self._settings
-        s.set("asr.type", self._asr_type_combo.currentData() or "whisper")
-        s.set("asr.model_size", self._model_size_combo.currentText())
-        s.set("asr.device", self._device_combo.currentText())
-        s.set("asr.language", self._language_combo.currentData() or "zh")
-        s.set("vad.threshold", self._vad_threshold.value())
-        s.set("vad.min_silence_duration_ms", self._silence_delay.value())
-        s.set("vad.max_speech_duration_s", self._max_speech_duration.value())
-        s.set("audio.padding_seconds", self._padding_spin.value())
-        s.set("subtitle.max_chars_per_subtitle", self._max_chars.value())
-        s.set("diarization.enabled", self._enable_diarization.isChecked())
-        s.set("translation.enabled", self._enable_translation.isChecked())
-        
-        # Map UI language selection to language code
-        lang_text = self._translation_target_lang.currentText()
-        lang_code = lang_text.split('(')[-1].replace(')', '')  # Extract code from "English (en)"
-        s.set("translation.target_language", lang_code)
-        
-        # Map UI source language selection to language code
-        source_lang_text = self._translation_source_lang.currentText()
-        source_lang_code = source_lang_text.split('(')[-1].replace(')', '')  # Extract code from "English (en)"
-        s.set("translation.source_language", source_lang_code)
-        
-        s.set("translation.model_size", self._translation_model_size.currentText())
-        
-        s.set("paths.model_dir", self._model_dir_input.text().strip())
-        
+        s.update("asr.type", self._asr_type_combo.currentData() or "whisper")
+        s.update("asr.model_size", self._model_size_combo.currentText())
+        s.update("asr.device", self._device_combo.currentText())
+        s.update("asr.language", self._language_combo.currentData() or "zh")
+        s.update("vad.threshold", self._vad_threshold.value())
+        s.update("vad.min_silence_duration_ms", self._silence_delay.value())
+        s.update("vad.max_speech_duration_s", self._max_speech_duration.value())
+        s.update("audio.padding_seconds", self._padding_spin.value())
+        s.update("subtitle.max_chars_per_subtitle", self._max_chars.value())
+        s.update("diarization.enabled", self._enable_diarization.isChecked())
+        s.update("translation.enabled", self._enable_translation.isChecked())
+
+        # Translation combos exist only after the first enable; until then
+        # the saved values are untouched
+        if self._translation_options_widget is not None:
+            # Codes are stored as item userData; text parsing is only the
+            # fallback for items added without one
+            s.update(
+                "translation.target_language",
+                self._translation_target_lang.currentData()
+                or _extract_lang_code(self._translation_target_lang.currentText(), "en"),
+            )
+            s.update(
+                "translation.source_language",
+                self._translation_source_lang.currentData()
+                or _extract_lang_code(self._translation_source_lang.currentText(), "zh"),
+            )
+
+            s.update("translation.model_size", self._translation_model_size.currentText())
+
+        s.update("paths.model_dir", self._model_dir_input.text().strip())
+
         # HuggingFace endpoint is managed through the dialog, not auto-saved from UI elements
 
+        if not flush_async:
+            s.save()
+            return
+        if self._flush_in_flight:
+            # A write is already running; retry once it is likely done so
+            # the values updated above still reach disk
+            self._save_timer.start()
+            return
+        self._flush_in_flight = True
+        QThreadPool.globalInstance().start(
+            _SettingsFlushTask(s, self._on_flush_done)
+        )
+
+    def _on_flush_done(self) -> None:
+        # Called from the pool thread; a plain bool store is atomic enough
+        # for this single-writer guard
+        self._flush_in_flight = False
+
     def _collect_config(self) -> dict:
-        """Build the pipeline config dict from current UI values."""
-        # Get current settings as base
-        config = self._settings.get_all()
-        
-        # Override with current UI values to ensure latest state is captured
-        config['diarization']['enabled'] = self._enable_diarization.isChecked()
-        config['translation']['enabled'] = self._enable_translation.isChecked()
-        
-        # Map UI language selection to language code
-        lang_text = self._translation_target_lang.currentText()
-        lang_code = lang_text.split('(')[-1].replace(')', '')  # Extract code from "English (en)"
-        config['translation']['target_language'] = lang_code
-        
-        # Map UI source language selection to language code
-        source_lang_text = self._translation_source_lang.currentText()
-        source_lang_code = source_lang_text.split('(')[-1].replace(')', '')  # Extract code from "English (en)"
-        config['translation']['source_language'] = source_lang_code
-        
-        config['translation']['model_size'] = self._translation_model_size.currentText()
-        
+        """Build the pipeline config dict from current UI values.
+
+        Starts from the settings snapshot and shallow-merges only the
+        subtrees the UI overrides, instead of deep-copying the whole
+        tree just to rewrite a handful of leaves. Untouched subtrees are
+        shared with the snapshot and must not be mutated downstream.
+        """
+        config = {**self._settings.snapshot()}
+
+        config['diarization'] = {
+            **config['diarization'],
+            'enabled': self._enable_diarization.isChecked(),
+        }
+
+        translation = {
+            **config['translation'],
+            'enabled': self._enable_translation.isChecked(),
+        }
+        # Translation combos exist only after the first enable; without
+        # them the saved values already apply
+        if self._translation_options_widget is not None:
+            # Codes are stored as item userData; text parsing is only the
+            # fallback for items added without one
+            translation['target_language'] = (
+                self._translation_target_lang.currentData()
+                or _extract_lang_code(self._translation_target_lang.currentText(), "en")
+            )
+            translation['source_language'] = (
+                self._translation_source_lang.currentData()
+                or _extract_lang_code(self._translation_source_lang.currentText(), "zh")
+            )
+
+            translation['model_size'] = self._translation_model_size.currentText()
+        config['translation'] = translation
+
         # Ensure huggingface endpoint is included in the config
-        config['huggingface']['endpoint'] = self._settings.get("huggingface.endpoint", "")
-        
+        config['huggingface'] = {
+            **config.get('huggingface', {}),
+            'endpoint': self._settings.get("huggingface.endpoint", ""),
+        }
+
         return config
 
     # ==================================================================
@@ -891,40 +1232,34 @@ class MainWindow(QMainWindow):
     # ==================================================================
 
     def _set_ui_enabled(self, enabled: bool) -> None:
-        """Toggle input controls and start/stop buttons."""
-        self._start_btn.setEnabled(enabled)
-        self._stop_btn.setEnabled(not enabled)
-        self._browse_input_btn.setEnabled(enabled)
-        self._browse_csv_btn.setEnabled(enabled)
-        self._browse_srt_btn.setEnabled(enabled)
-        self._asr_type_combo.setEnabled(enabled)
-        self._model_size_combo.setEnabled(enabled)
-        self._device_combo.setEnabled(enabled)
-        self._enable_diarization.setEnabled(enabled)
-        self._language_combo.setEnabled(enabled)
-        self._vad_threshold.setEnabled(enabled)
-        self._silence_delay.setEnabled(enabled)
-        self._padding_spin.setEnabled(enabled)
-        self._max_chars.setEnabled(enabled)
-        self._max_speech_duration.setEnabled(enabled)
-        self._model_dir_input.setEnabled(enabled)
-        self._browse_model_dir_btn.setEnabled(enabled)
-        self._reset_btn.setEnabled(enabled)
-        
-        # Enable translation-related widgets
-        self._enable_translation.setEnabled(enabled)
-        self._translation_model_size.setEnabled(enabled)
-        self._translation_source_lang.setEnabled(enabled)
-        self._translation_target_lang.setEnabled(enabled)
-        
+        """Toggle input controls and start/stop buttons.
+
+        Updates are suspended around the loop so Qt coalesces the style
+        re-polish and repaint of all controls into one pass.
+        """
+        self.setUpdatesEnabled(False)
+        try:
+            for w in self._toggleable_widgets:
+                w.setEnabled(enabled)
+            self._stop_btn.setEnabled(not enabled)
+            # Translation option rows may not have been built yet
+            if self._translation_options_widget is not None:
+                self._translation_model_size.setEnabled(enabled)
+                self._translation_source_lang.setEnabled(enabled)
+                self._translation_target_lang.setEnabled(enabled)
+        finally:
+            self.setUpdatesEnabled(True)
+
         if not enabled:
             self._status_label.setStyleSheet("font-weight: bold; color: #E0E0E0;")
-        
+
         # 日志输出部分的按钮始终可用，所以不需要改变它们的状态
         # self._clear_log_btn 和 self._export_log_btn 始终保持启用状态
 
     def closeEvent(self, event) -> None:  # noqa: N802
-        self._auto_save()
+        # Flush any pending debounced save synchronously before exiting
+        self._save_timer.stop()
+        self._do_save(flush_async=False)
         # If worker is running, ask to stop
         if self._worker is not None and self._worker.isRunning():
             reply = QMessageBox.question(
@@ -938,7 +1273,19 @@ class MainWindow(QMainWindow):
                 event.ignore()
                 return
             self._worker.cancel()
-            self._worker.wait(5000)
+            # Wait for the worker with the event loop still running:
+            # QThread.wait would block paint/close dispatch and make the
+            # window appear frozen for up to the full timeout
+            if self._worker.isRunning():
+                loop = QEventLoop()
+                self._worker.finished.connect(loop.quit)
+                QTimer.singleShot(5000, loop.quit)
+                loop.exec_()
+                try:
+                    self._worker.finished.disconnect(loop.quit)
+                except TypeError:
+                    pass  # already disconnected with the thread's teardown
+        self._disconnect_signals()
         event.accept()
 
     def _validate_hf_token(self, token: str) -> bool:
@@ -975,7 +1322,6 @@ class MainWindow(QMainWindow):
 
     def _show_hf_endpoint_dialog(self) -> None:
         """Show dialog to configure HuggingFace endpoint."""
-        from PyQt5.QtWidgets import QDialog, QVBoxLayout, QHBoxLayout, QComboBox, QPushButton, QLabel, QLineEdit, QDialogButtonBox
         
         dialog = QDialog(self)
         dialog.setWindowTitle("HuggingFace Endpoint 设置")
@@ -1014,7 +1360,7 @@ class MainWindow(QMainWindow):
         custom_layout = QHBoxLayout()
         custom_label = QLabel("自定义地址:")
         self._custom_endpoint_input = QLineEdit()
-        self._custom_endpoint_input.setText(current_endpoint if current_endpoint not in ["", "https://hf-mirror.com"] else "")
+        self._custom_endpoint_input.setText(current_endpoint if current_endpoint not in _KNOWN_HF_ENDPOINTS else "")
         self._custom_endpoint_input.setPlaceholderText("请输入自定义 HuggingFace 镜像地址")
         
         custom_layout.addWidget(custom_label)
@@ -1048,7 +1394,7 @@ class MainWindow(QMainWindow):
             else:  # 自定义
                 endpoint = self._custom_endpoint_input.text().strip()
                 # If custom endpoint is not empty, add it to the combo options
-                if endpoint and endpoint not in ["", "https://hf-mirror.com"]:
+                if endpoint and endpoint not in _KNOWN_HF_ENDPOINTS:
                     # In a real implementation, we might want to store custom endpoints
                     # but for this implementation we just save the endpoint value
                     pass
@@ -1061,7 +1407,6 @@ class MainWindow(QMainWindow):
                 os.environ['HF_ENDPOINT'] = endpoint
                 logger.info(f"Using HuggingFace endpoint: {endpoint}")
                 # Inform user that they may need to restart the app for the change to take full effect
-                from PyQt5.QtWidgets import QMessageBox
                 reply = QMessageBox.question(
                     self,
                     "HuggingFace Endpoint 已更新",
@@ -1077,7 +1422,6 @@ class MainWindow(QMainWindow):
                     del os.environ['HF_ENDPOINT']
                 logger.info("HuggingFace endpoint 已设置为: 官网默认")
                 # Inform user that they may need to restart the app for the change to take full effect
-                from PyQt5.QtWidgets import QMessageBox
                 reply = QMessageBox.question(
                     self,
                     "HuggingFace Endpoint 已更新",
@@ -1090,7 +1434,6 @@ class MainWindow(QMainWindow):
 
     def _show_hf_token_dialog(self) -> None:
         """Show dialog to configure HuggingFace token."""
-        from PyQt5.QtWidgets import QDialog, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QLineEdit, QDialogButtonBox
         
         dialog = QDialog(self)
         dialog.setWindowTitle("HuggingFace Token 设置")
@@ -1138,7 +1481,6 @@ class MainWindow(QMainWindow):
                 
                 if login_success:
                     logger.info("HuggingFace token 已设置并登录成功")
-                    from PyQt5.QtWidgets import QMessageBox
                     QMessageBox.information(
                         self,
                         "登录成功",
@@ -1146,7 +1488,6 @@ class MainWindow(QMainWindow):
                     )
                 else:
                     logger.warning("HuggingFace token 登录失败")
-                    from PyQt5.QtWidgets import QMessageBox
                     QMessageBox.warning(
                         self,
                         "登录失败",
@@ -1157,7 +1498,6 @@ class MainWindow(QMainWindow):
                 from huggingface_hub import logout
                 logout()
                 logger.info("已从 HuggingFace Hub 登出")
-                from PyQt5.QtWidgets import QMessageBox
                 QMessageBox.information(
                     self,
                     "登出成功",
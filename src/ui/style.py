@@ -2,10 +2,9 @@
 
 from __future__ import annotations
 
-
-def get_dark_stylesheet() -> str:
-    """Return a complete QSS string for the modern dark theme."""
-    return """
+# Bound once at import; every caller gets the same string object, which
+# lets Qt short-circuit stylesheet comparisons by identity
+_DARK_QSS: str = """
 /* ================================================================
    Global
    ================================================================ */
@@ -227,9 +226,9 @@ QProgressBar::chunk {
 }
 
 /* ================================================================
-   QTextEdit (log viewer)
+   QPlainTextEdit (log viewer)
    ================================================================ */
-QTextEdit#log_viewer {
+QPlainTextEdit#log_viewer {
     background-color: #14142A;
     border: 1px solid #3A3A4E;
     border-radius: 4px;
@@ -303,3 +302,8 @@ QStatusBar {
     border-top: 1px solid #3A3A4E;
 }
 """
+
+
+def get_dark_stylesheet() -> str:
+    """Return the complete QSS string for the modern dark theme."""
+    return _DARK_QSS
@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
+import time
+
 from PyQt5.QtCore import QThread, pyqtSignal
 from loguru import logger
 
-from src.core.pipeline import SubtitlePipeline
-from src.models.datatypes import CancelledException
+from src.core.pipeline import CancelledException, SubtitlePipeline
 
 
 class PipelineWorker(QThread):
@@ -42,11 +43,30 @@ class PipelineWorker(QThread):
         self._csv_path = csv_path
         self._srt_path = srt_path
         self._pipeline: SubtitlePipeline | None = None
+        # Progress coalescing state: stages emitting sub-percent ticks
+        # every few ms would otherwise queue thousands of cross-thread
+        # signal deliveries to the GUI
+        self._last_emit_t = 0.0
+        self._last_pct = -1.0
+        self._last_step = ""
 
     def run(self) -> None:
         """Entry point executed on the worker thread."""
         def _on_progress(step: str, pct: float, msg: str) -> None:
-            self.progress_updated.emit(step, pct, msg)
+            # Forward a tick only on a step change, a full percent of
+            # movement, ~50 ms of quiet, or completion — same visible
+            # fidelity, a fraction of the queued-connection traffic
+            now = time.monotonic()
+            if (
+                step != self._last_step
+                or pct - self._last_pct >= 1.0
+                or now - self._last_emit_t > 0.05
+                or pct >= 100.0
+            ):
+                self._last_emit_t = now
+                self._last_pct = pct
+                self._last_step = step
+                self.progress_updated.emit(step, pct, msg)
 
         self._pipeline = SubtitlePipeline(
             config=self._config,
@@ -2,11 +2,20 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
+
 from loguru import logger
 
 
+@lru_cache(maxsize=1)
 def get_available_devices() -> list[str]:
-    """Return a list of available compute devices."""
+    """Return a list of available compute devices.
+
+    Cached for the process lifetime: device topology does not change
+    while running, and the CUDA probe behind ``is_available`` is a
+    driver round-trip. Callers must not mutate the returned list;
+    tests can reset via ``get_available_devices.cache_clear()``.
+    """
     devices = ["cpu"]
     try:
         import torch
@@ -31,8 +40,13 @@ def get_device(preferred: str = "cpu") -> str:
     return "cpu"
 
 
+@lru_cache(maxsize=1)
 def get_device_display_info() -> str:
-    """Return a short string describing the compute environment for the UI status bar."""
+    """Return a short string describing the compute environment for the UI status bar.
+
+    Cached like :func:`get_available_devices`; repeated status-bar
+    refreshes reuse the first probe's result.
+    """
     try:
         import torch
 
@@ -10,8 +10,8 @@ from pathlib import Path
 from loguru import logger
 
 
-def _get_log_dir() -> Path:
-    """Return platform-appropriate log directory."""
+def _resolve_log_dir() -> Path:
+    """Compute the platform-appropriate log directory."""
     system = platform.system()
     if system == "Windows":
         base = os.environ.get("LOCALAPPDATA", Path.home() / "AppData" / "Local")
@@ -25,6 +25,16 @@ def _get_log_dir() -> Path:
         return Path(data_home) / "subtitle_extractor" / "logs"
 
 
+# OS facts (uname, environment) don't change within a process: resolve
+# the directory once at import and share it with any future caller
+_LOG_DIR: Path = _resolve_log_dir()
+
+
+def _get_log_dir() -> Path:
+    """Return the platform-appropriate log directory."""
+    return _LOG_DIR
+
+
 def setup_logger(log_level: str = "INFO") -> None:
     """Configure loguru with console and rotating file sinks.
 
@@ -34,20 +44,30 @@ def setup_logger(log_level: str = "INFO") -> None:
     # Remove the default stderr sink so we can add our own
     logger.remove()
 
-    # Console sink (coloured)
-    logger.add(
-        sys.stderr,
-        level=log_level,
-        format=(
-            "<green>{time:YYYY-MM-DD HH:mm:ss}</green> | "
-            "<level>{level: <4}</level> | "
-            "<cyan>{file}</cyan>:<cyan>{line}</cyan> | "
-            "<level>{message}</level>"
-        ),
-        colorize=True,
-    )
+    # Console sink: colour markup is only worth parsing when a terminal
+    # is attached; a GUI launch gets a minimal plain format instead
+    if bool(getattr(sys.stderr, "isatty", lambda: False)()):
+        logger.add(
+            sys.stderr,
+            level=log_level,
+            format=(
+                "<green>{time:YYYY-MM-DD HH:mm:ss}</green> | "
+                "<level>{level: <4}</level> | "
+                "<level>{message}</level>"
+            ),
+            colorize=True,
+        )
+    elif sys.stderr is not None:
+        logger.add(
+            sys.stderr,
+            level=log_level,
+            format="{time:HH:mm:ss} | {level: <4} | {message}",
+            colorize=False,
+        )
 
-    # Rotating file sink
+    # Rotating file sink. This is the only sink that pays for
+    # {file}:{line} — loguru resolves them via frame inspection per
+    # record, which the user-facing sinks above deliberately skip
     log_dir = _get_log_dir()
     log_dir.mkdir(parents=True, exist_ok=True)
     logger.add(